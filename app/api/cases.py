@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import uuid
 from datetime import datetime, timezone
 
 import asyncpg
 import redis.asyncio as redis
-from fastapi import APIRouter, Depends, HTTPException
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
 
 from app.api.deps import get_db_pool, get_redis
 from app.db import queries
@@ -23,21 +25,15 @@ from app.services import cache_service, llm_service
 
 router = APIRouter(prefix="/api/v1/cases", tags=["cases"])
 
+# Process-local cache of case response bodies for hot GETs, in front of Redis.
+# Writes in this process evict immediately; other workers see changes within the TTL.
+_local_cache: TTLCache[uuid.UUID, str] = TTLCache(maxsize=1024, ttl=30)
+
+_CASE_LIST = TypeAdapter(list[MedicalCase])
 
-def _row_to_case(row: dict) -> MedicalCase:
-    data = row["case_data"]
-    if isinstance(data, str):
-        data = json.loads(data)
-    data.update(
-        case_id=str(row["case_id"]),
-        case_number=row.get("case_number"),
-        case_title=row["case_title"],
-        specialty=row["specialty"],
-        difficulty=row["difficulty"],
-        created_at=row["created_at"].isoformat() if isinstance(row["created_at"], datetime) else row["created_at"],
-        updated_at=row["updated_at"].isoformat() if isinstance(row["updated_at"], datetime) else row["updated_at"],
-    )
-    return MedicalCase.model_validate(data)
+
+def _row_to_case(row: asyncpg.Record) -> MedicalCase:
+    return MedicalCase.model_validate_json(row["case_json"])
 
 
 # ── Generate ───────────────────────────────────────────────────────────────────
@@ -54,17 +50,27 @@ async def generate_case(
         difficulty=body.difficulty.value if body.difficulty else None,
     )
     diff = case.difficulty.value if hasattr(case.difficulty, "value") else case.difficulty
-    case_dict = case.model_dump(mode="json")
-    await queries.insert_case(
+    # The LLM fills created_at in (the strict schema requires it), so stamp a
+    # server-side time instead; the response, the cached copy and the DB
+    # columns list_cases sorts on all carry the same value.
+    now = datetime.now(timezone.utc)
+    case.created_at = case.updated_at = now
+    # The case number is assigned by Postgres and merged back in on read, so
+    # the stored document leaves it out; the response body is dumped once the
+    # number is known.
+    case_number = await queries.insert_case(
         pool,
         case_id=case.case_id,
         case_title=case.case_title,
         specialty=case.specialty,
         difficulty=diff,
-        case_data=case_dict,
+        case_data_json=case.model_dump_json(exclude={"case_number"}),
+        now=now,
     )
-    await cache_service.set_cached_case(r, case.case_id, case_dict)
-    return case
+    case_json = case.model_copy(update={"case_number": case_number}).model_dump_json()
+    # Cache the case under both keys and bump the list version in one pipeline.
+    await cache_service.cache_written_case(r, case.case_id, case_json, case_number=case_number)
+    return Response(content=case_json, media_type="application/json")
 
 
 # ── CRUD ───────────────────────────────────────────────────────────────────────
@@ -75,79 +81,110 @@ async def create_case(
     pool: asyncpg.Pool = Depends(get_db_pool),
     r: redis.Redis = Depends(get_redis),
 ):
-    case_id = str(uuid.uuid4())
+    case_id = uuid.uuid4()
     now = datetime.now(timezone.utc)
+    timestamp = now.isoformat()
     full_data = {
         **body.case_data,
         "case_id": case_id,
         "case_title": body.case_title,
         "specialty": body.specialty,
         "difficulty": body.difficulty.value,
-        "created_at": now.isoformat(),
-        "updated_at": now.isoformat(),
+        "created_at": timestamp,
+        "updated_at": timestamp,
     }
     case = MedicalCase.model_validate(full_data)
-    case_dict = case.model_dump(mode="json")
-    await queries.insert_case(
-        pool,
-        case_id=case_id,
-        case_title=body.case_title,
-        specialty=body.specialty,
-        difficulty=body.difficulty.value,
-        case_data=case_dict,
+    case_json = case.model_dump_json()
+    await asyncio.gather(
+        queries.insert_case(
+            pool,
+            case_id=case_id,
+            case_title=body.case_title,
+            specialty=body.specialty,
+            difficulty=body.difficulty.value,
+            case_data_json=case_json,
+            now=now,
+        ),
+        cache_service.cache_written_case(r, case_id, case_json),
     )
-    await cache_service.set_cached_case(r, case_id, case_dict)
-    return case
+    # case_json is already the validated response body; returning it directly
+    # skips FastAPI's response_model re-validation and re-serialization.
+    return Response(content=case_json, media_type="application/json", status_code=201)
 
 
 @router.get("/", response_model=CaseListResponse)
 async def list_cases(
-    page: int = 1,
-    page_size: int = 20,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
     specialty: str | None = None,
     search: str | None = None,
     pool: asyncpg.Pool = Depends(get_db_pool),
+    r: redis.Redis = Depends(get_redis),
 ):
-    rows, total = await queries.list_cases(
-        pool, page=page, page_size=page_size, specialty=specialty, search=search,
+    key = await cache_service.case_list_key(
+        r, page=page, page_size=page_size, specialty=specialty, search=search,
     )
-    items = [_row_to_case(r) for r in rows]
-    return CaseListResponse(items=items, total=total, page=page, page_size=page_size)
+    body = await cache_service.get_cached_case_list(r, key)
+    if body is None:
+        items, total = await queries.list_cases_json(
+            pool, page=page, page_size=page_size, specialty=specialty, search=search,
+        )
+        # Stored documents aren't guaranteed to match MedicalCase (PATCH merges
+        # case_data in SQL, and older rows predate the schema), so validate the
+        # page in one pass and splice the canonical items into the envelope.
+        # Only cache misses pay for this; the cached body is already canonical.
+        items = _CASE_LIST.dump_json(_CASE_LIST.validate_json(items)).decode()
+        body = f'{{"items":{items},"total":{total},"page":{page},"page_size":{page_size}}}'
+        await cache_service.set_cached_case_list(r, key, body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/by-number/{case_number}", response_model=MedicalCase)
 async def get_case_by_number(
     case_number: int,
     pool: asyncpg.Pool = Depends(get_db_pool),
+    r: redis.Redis = Depends(get_redis),
 ):
+    case_id = await cache_service.get_cached_case_id(r, case_number)
+    if case_id:
+        body = await cache_service.get_cached_case_json(r, case_id)
+        if body is not None:
+            return Response(content=body, media_type="application/json")
+
     row = await queries.get_case_by_number(pool, case_number)
     if not row:
         raise HTTPException(status_code=404, detail="Case not found")
-    return _row_to_case(row)
+
+    # Round-trip the DB document through the model once so that what lands in
+    # Redis is canonical and can be served verbatim on later hits.
+    case = _row_to_case(row)
+    body = case.model_dump_json()
+    await cache_service.set_cached_case(r, case.case_id, body, case_number=case_number)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{case_id}", response_model=MedicalCase)
 async def get_case(
-    case_id: str,
+    case_id: uuid.UUID,
     pool: asyncpg.Pool = Depends(get_db_pool),
     r: redis.Redis = Depends(get_redis),
 ):
-    cached = await cache_service.get_cached_case(r, case_id)
-    if cached:
-        return MedicalCase.model_validate(cached)
-
-    row = await queries.get_case_by_id(pool, case_id)
-    if not row:
-        raise HTTPException(status_code=404, detail="Case not found")
-
-    case = _row_to_case(row)
-    await cache_service.set_cached_case(r, case_id, case.model_dump(mode="json"))
-    return case
+    body = _local_cache.get(case_id)
+    if body is None:
+        body = await cache_service.get_cached_case_json(r, case_id)
+        if body is None:
+            row = await queries.get_case_by_id(pool, case_id)
+            if not row:
+                raise HTTPException(status_code=404, detail="Case not found")
+            body = _row_to_case(row).model_dump_json()
+            await cache_service.set_cached_case(r, case_id, body)
+        _local_cache[case_id] = body
+    return Response(content=body, media_type="application/json")
 
 
 @router.put("/{case_id}", response_model=MedicalCase)
 async def replace_case(
-    case_id: str,
+    case_id: uuid.UUID,
     body: CaseCreateRequest,
     pool: asyncpg.Pool = Depends(get_db_pool),
     r: redis.Redis = Depends(get_redis),
@@ -162,7 +199,7 @@ async def replace_case(
         "updated_at": now.isoformat(),
     }
     case = MedicalCase.model_validate(full_data)
-    case_dict = case.model_dump(mode="json")
+    case_json = case.model_dump_json()
     row = await queries.update_case(
         pool,
         case_id,
@@ -170,26 +207,24 @@ async def replace_case(
             "case_title": body.case_title,
             "specialty": body.specialty,
             "difficulty": body.difficulty.value,
-            "case_data": case_dict,
+            "case_data": case_json,
         },
+        now=now,
     )
     if not row:
         raise HTTPException(status_code=404, detail="Case not found")
-    await cache_service.set_cached_case(r, case_id, case_dict)
-    return case
+    _local_cache.pop(case_id, None)
+    await cache_service.cache_written_case(r, case_id, case_json)
+    return Response(content=case_json, media_type="application/json")
 
 
 @router.patch("/{case_id}", response_model=MedicalCase)
 async def patch_case(
-    case_id: str,
+    case_id: uuid.UUID,
     body: CaseUpdateRequest,
     pool: asyncpg.Pool = Depends(get_db_pool),
     r: redis.Redis = Depends(get_redis),
 ):
-    existing = await queries.get_case_by_id(pool, case_id)
-    if not existing:
-        raise HTTPException(status_code=404, detail="Case not found")
-
     updates: dict = {}
     if body.case_title is not None:
         updates["case_title"] = body.case_title
@@ -198,32 +233,36 @@ async def patch_case(
     if body.difficulty is not None:
         updates["difficulty"] = body.difficulty.value
 
-    if body.case_data is not None:
-        current_data = existing["case_data"]
-        if isinstance(current_data, str):
-            current_data = json.loads(current_data)
-        current_data.update(body.case_data)
-        updates["case_data"] = current_data
-
-    if not updates:
-        return _row_to_case(existing)
+    if not updates and body.case_data is None:
+        row = await queries.get_case_by_id(pool, case_id)
+        if not row:
+            raise HTTPException(status_code=404, detail="Case not found")
+        return _row_to_case(row)
 
-    row = await queries.update_case(pool, case_id, updates=updates)
+    # case_data is merged into the stored document by Postgres (jsonb ||),
+    # so the existing row is never fetched first; unchanged rows are not
+    # rewritten and keep their cache entries.
+    row = await queries.update_case(
+        pool, case_id, updates=updates, case_data_patch=body.case_data,
+    )
     if not row:
         raise HTTPException(status_code=404, detail="Case not found")
 
     case = _row_to_case(row)
-    await cache_service.invalidate_case(r, case_id)
+    if row["changed"]:
+        _local_cache.pop(case_id, None)
+        await cache_service.invalidate_case(r, case_id)
     return case
 
 
 @router.delete("/{case_id}", status_code=204)
 async def delete_case(
-    case_id: str,
+    case_id: uuid.UUID,
     pool: asyncpg.Pool = Depends(get_db_pool),
     r: redis.Redis = Depends(get_redis),
 ):
     deleted = await queries.delete_case(pool, case_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Case not found")
+    _local_cache.pop(case_id, None)
     await cache_service.invalidate_case(r, case_id)
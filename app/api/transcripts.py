@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import asyncpg
-from fastapi import APIRouter, Depends, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response
 
 from app.api.deps import get_db_pool
 from app.db.queries import insert_transcript, list_transcripts_by_case
@@ -22,6 +23,7 @@ async def save_transcript(
         conversation_id=body.conversation_id,
         case_number=body.case_number,
         transcript=body.transcript,
+        append=body.append,
     )
     return TranscriptSaveResponse(
         conversation_id=str(row["conversation_id"]),
@@ -38,12 +40,15 @@ async def get_transcripts_by_case(
     rows = await list_transcripts_by_case(pool, case_number)
     if not rows:
         raise HTTPException(status_code=404, detail=f"No transcripts found for case #{case_number}")
-    return [
+    # transcript arrives decoded by the jsonb codec; orjson encodes it together
+    # with the UUID and datetime columns in a single pass.
+    body = orjson.dumps([
         {
-            "conversation_id": str(r["conversation_id"]),
+            "conversation_id": r["conversation_id"],
             "case_number": r["case_number"],
             "transcript": r["transcript"],
-            "created_at": r["created_at"].isoformat(),
+            "created_at": r["created_at"],
         }
         for r in rows
-    ]
+    ])
+    return Response(content=body, media_type="application/json")
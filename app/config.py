@@ -15,7 +15,12 @@ class Settings:
     OPENAI_AUDIO_MODEL: str = os.getenv("OPENAI_AUDIO_MODEL", "gpt-4o-audio-preview")
     ANTHROPIC_API_KEY: str = os.getenv("ANTHROPIC_API_KEY", "")
     DATABASE_URL: str = os.getenv("DATABASE_URL", "postgresql://localhost:5432/medcases")
+    DB_POOL_MIN: int = int(os.getenv("DB_POOL_MIN", "10"))
+    DB_POOL_MAX: int = int(os.getenv("DB_POOL_MAX", "50"))
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    # Comma-separated browser origins allowed by CORS; empty disables the middleware.
+    CORS_ORIGINS: list[str] = [o.strip() for o in os.getenv("CORS_ORIGINS", "").split(",") if o.strip()]
+    JUDGE_CONCURRENCY: int = int(os.getenv("JUDGE_CONCURRENCY", "8"))
 
 
 settings = Settings()
@@ -3,15 +3,50 @@
 from __future__ import annotations
 
 import asyncpg
+import orjson
 
 from app.config import settings
 
 _pool: asyncpg.Pool | None = None
 
+# Binary jsonb wire format is a version byte followed by the JSON text.
+_JSONB_VERSION = b"\x01"
+
+
+def _encode_jsonb(value) -> bytes:
+    # Pre-serialized JSON (str/bytes) is sent as-is; anything else is dumped.
+    if isinstance(value, str):
+        value = value.encode()
+    elif not isinstance(value, bytes):
+        value = orjson.dumps(value)
+    return _JSONB_VERSION + value
+
+
+def _decode_jsonb(data: bytes):
+    return orjson.loads(memoryview(data)[1:])
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        schema="pg_catalog",
+        format="binary",
+    )
+
 
 async def create_pool() -> asyncpg.Pool:
     global _pool
-    _pool = await asyncpg.create_pool(dsn=settings.DATABASE_URL, min_size=2, max_size=10)
+    _pool = await asyncpg.create_pool(
+        dsn=settings.DATABASE_URL,
+        min_size=settings.DB_POOL_MIN,
+        max_size=settings.DB_POOL_MAX,
+        max_inactive_connection_lifetime=300,
+        statement_cache_size=1024,
+        command_timeout=30,
+        init=_init_connection,
+    )
     return _pool
 
 
@@ -2,13 +2,59 @@
 
 from __future__ import annotations
 
-import json
 import uuid
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from pathlib import Path
 
 import asyncpg
 
+# Static statements live at module level; asyncpg keys its per-connection
+# prepared-statement cache on the query text.
+_INSERT_CASE_SQL = """
+    INSERT INTO cases (case_id, case_title, specialty, difficulty, case_data, created_at, updated_at)
+    VALUES ($1, $2, $3, $4, $5::jsonb, $6, $7)
+    RETURNING case_number
+"""
+_CASE_COPY_COLUMNS = (
+    "case_id", "case_title", "specialty", "difficulty", "case_data", "created_at", "updated_at",
+)
+
+# Full MedicalCase document with the denormalized columns merged in by
+# Postgres. Read paths return it as text so pydantic can parse and validate
+# it in one pass (or pass it through untouched).
+_CASE_DOC = """
+    case_data || jsonb_build_object(
+        'case_id', case_id,
+        'case_number', case_number,
+        'case_title', case_title,
+        'specialty', specialty,
+        'difficulty', difficulty,
+        'created_at', created_at,
+        'updated_at', updated_at
+    )
+"""
+_CASE_JSON_COLUMN = f"({_CASE_DOC})::text AS case_json"
+
+_SELECT_CASE_BY_ID_SQL = f"SELECT {_CASE_JSON_COLUMN} FROM cases WHERE case_id = $1"  # noqa: S608
+_SELECT_UNCHANGED_CASE_SQL = f"SELECT {_CASE_JSON_COLUMN}, false AS changed FROM cases WHERE case_id = $1"  # noqa: S608
+_SELECT_CASE_BY_NUMBER_SQL = f"SELECT {_CASE_JSON_COLUMN} FROM cases WHERE case_number = $1"  # noqa: S608
+_DELETE_CASE_SQL = "DELETE FROM cases WHERE case_id = $1"
+
+_UPSERT_TRANSCRIPT_SQL = """
+    INSERT INTO interview_transcripts (conversation_id, case_number, transcript)
+    VALUES ($1, $2, $3::jsonb)
+    ON CONFLICT (conversation_id) DO UPDATE
+        SET transcript = CASE WHEN $4
+                              THEN interview_transcripts.transcript || EXCLUDED.transcript
+                              ELSE EXCLUDED.transcript END,
+            case_number = EXCLUDED.case_number
+    RETURNING *
+"""
+_LIST_TRANSCRIPTS_SQL = (
+    "SELECT * FROM interview_transcripts WHERE case_number = $1 ORDER BY created_at DESC"
+)
+
 
 async def init_schema(pool: asyncpg.Pool) -> None:
     sql = (Path(__file__).parent / "schema.sql").read_text()
@@ -19,97 +65,163 @@ async def init_schema(pool: asyncpg.Pool) -> None:
 async def insert_case(
     pool: asyncpg.Pool,
     *,
-    case_id: str,
+    case_id: uuid.UUID,
     case_title: str,
     specialty: str,
     difficulty: str,
-    case_data: dict,
-) -> dict:
-    now = datetime.now(timezone.utc)
+    case_data_json: str,
+    now: datetime | None = None,
+) -> int:
+    now = now or datetime.now(timezone.utc)
     async with pool.acquire() as conn:
-        row = await conn.fetchrow(
-            """
-            INSERT INTO cases (case_id, case_title, specialty, difficulty, case_data, created_at, updated_at)
-            VALUES ($1, $2, $3, $4, $5::jsonb, $6, $7)
-            RETURNING *
-            """,
-            uuid.UUID(case_id),
+        return await conn.fetchval(
+            _INSERT_CASE_SQL,
+            case_id,
             case_title,
             specialty,
             difficulty,
-            json.dumps(case_data),
+            case_data_json,
             now,
             now,
         )
-    return dict(row)
 
 
-async def get_case_by_id(pool: asyncpg.Pool, case_id: str) -> dict | None:
+async def insert_cases_many(pool: asyncpg.Pool, records: Iterable[tuple]) -> None:
+    """Bulk-insert cases via binary COPY.
+
+    Each record is ``(case_id, case_title, specialty, difficulty, case_data_json,
+    created_at, updated_at)``.
+    """
     async with pool.acquire() as conn:
-        row = await conn.fetchrow("SELECT * FROM cases WHERE case_id = $1", uuid.UUID(case_id))
-    return dict(row) if row else None
+        await conn.copy_records_to_table("cases", records=records, columns=_CASE_COPY_COLUMNS)
 
 
-async def get_case_by_number(pool: asyncpg.Pool, case_number: int) -> dict | None:
+async def get_case_by_id(pool: asyncpg.Pool, case_id: uuid.UUID) -> asyncpg.Record | None:
     async with pool.acquire() as conn:
-        row = await conn.fetchrow("SELECT * FROM cases WHERE case_number = $1", case_number)
-    return dict(row) if row else None
+        row = await conn.fetchrow(_SELECT_CASE_BY_ID_SQL, case_id)
+    return row
+
+
+async def get_case_by_number(pool: asyncpg.Pool, case_number: int) -> asyncpg.Record | None:
+    async with pool.acquire() as conn:
+        row = await conn.fetchrow(_SELECT_CASE_BY_NUMBER_SQL, case_number)
+    return row
+
+
+def _list_cases_sql(has_specialty: bool, has_search: bool) -> tuple[str, str]:
+    conditions = []
+    if has_specialty:
+        conditions.append(f"specialty = ${len(conditions) + 1}")
+    if has_search:
+        conditions.append(f"case_title ILIKE ${len(conditions) + 1}")
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    n = len(conditions)
+
+    # count(*) OVER () returns the total alongside the page in one round-trip.
+    list_sql = f"""
+        WITH page AS (
+            SELECT {_CASE_DOC} AS doc, created_at, count(*) OVER () AS total_count
+            FROM cases {where}
+            ORDER BY created_at DESC
+            LIMIT ${n + 1} OFFSET ${n + 2}
+        )
+        SELECT coalesce(jsonb_agg(doc ORDER BY created_at DESC), '[]')::text AS items,
+               max(total_count) AS total
+        FROM page
+    """  # noqa: S608
+    count_sql = f"SELECT count(*) FROM cases {where}"  # noqa: S608
+    return list_sql, count_sql
+
+
+# One fixed query text per filter combination, keyed (has_specialty, has_search),
+# so asyncpg's statement cache reuses the prepared plans.
+_LIST_CASES_SQL = {
+    (has_specialty, has_search): _list_cases_sql(has_specialty, has_search)
+    for has_specialty in (False, True)
+    for has_search in (False, True)
+}
 
 
-async def list_cases(
+async def list_cases_json(
     pool: asyncpg.Pool,
     *,
     page: int = 1,
     page_size: int = 20,
     specialty: str | None = None,
     search: str | None = None,
-) -> tuple[list[dict], int]:
+) -> tuple[str, int]:
+    """Return one page of cases as a JSON array string, plus the total count.
+
+    Postgres assembles the array itself, so rows are never materialized as
+    Python objects on the way to the response body.
+    """
     offset = (page - 1) * page_size
-    conditions = []
     params: list = []
-
     if specialty:
-        conditions.append(f"specialty = ${len(params) + 1}")
         params.append(specialty)
-
     if search:
-        conditions.append(f"case_title ILIKE ${len(params) + 1}")
         params.append(f"%{search}%")
 
-    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-
+    list_sql, count_sql = _LIST_CASES_SQL[bool(specialty), bool(search)]
     async with pool.acquire() as conn:
-        count = await conn.fetchval(f"SELECT count(*) FROM cases {where}", *params)  # noqa: S608
-        rows = await conn.fetch(
-            f"SELECT * FROM cases {where} ORDER BY created_at DESC LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}",  # noqa: S608
-            *params,
-            page_size,
-            offset,
-        )
-    return [dict(r) for r in rows], count
+        row = await conn.fetchrow(list_sql, *params, page_size, offset)
+        count = row["total"]
+        if count is None:
+            # Empty page — past the end, the window count has no row to ride on.
+            count = await conn.fetchval(count_sql, *params) if offset else 0
+    return row["items"], count
 
 
-async def update_case(pool: asyncpg.Pool, case_id: str, *, updates: dict) -> dict | None:
+async def update_case(
+    pool: asyncpg.Pool,
+    case_id: uuid.UUID,
+    *,
+    updates: dict,
+    case_data_patch: dict | None = None,
+    now: datetime | None = None,
+) -> asyncpg.Record | None:
+    """Apply *updates* (and an optional case_data merge) to one case.
+
+    Rows whose values would not change are left untouched, so a no-op PATCH
+    costs no write. The returned row carries ``changed`` to tell the two
+    apart; ``None`` means the case does not exist.
+    """
     set_clauses = []
+    changes = []
     params: list = []
     for key, value in updates.items():
-        params.append(json.dumps(value) if key == "case_data" else value)
-        set_clauses.append(f"{key} = ${len(params)}{'::jsonb' if key == 'case_data' else ''}")
-
-    params.append(datetime.now(timezone.utc))
+        params.append(value)
+        new_value = f"${len(params)}{'::jsonb' if key == 'case_data' else ''}"
+        set_clauses.append(f"{key} = {new_value}")
+        changes.append(f"{key} IS DISTINCT FROM {new_value}")
+
+    if case_data_patch is not None:
+        # Shallow-merge server-side so the stored document never round-trips.
+        params.append(case_data_patch)
+        set_clauses.append(f"case_data = case_data || ${len(params)}::jsonb")
+        changes.append(f"case_data IS DISTINCT FROM case_data || ${len(params)}::jsonb")
+
+    params.append(now or datetime.now(timezone.utc))
     set_clauses.append(f"updated_at = ${len(params)}")
 
-    params.append(uuid.UUID(case_id))
-    sql = f"UPDATE cases SET {', '.join(set_clauses)} WHERE case_id = ${len(params)} RETURNING *"  # noqa: S608
+    params.append(case_id)
+    sql = f"""
+        UPDATE cases SET {', '.join(set_clauses)}
+        WHERE case_id = ${len(params)} AND ({' OR '.join(changes)})
+        RETURNING {_CASE_JSON_COLUMN}, true AS changed
+    """  # noqa: S608
 
     async with pool.acquire() as conn:
         row = await conn.fetchrow(sql, *params)
-    return dict(row) if row else None
+        if row is None:
+            # Either missing or already up to date — only the latter has a row.
+            row = await conn.fetchrow(_SELECT_UNCHANGED_CASE_SQL, case_id)
+    return row
 
 
-async def delete_case(pool: asyncpg.Pool, case_id: str) -> bool:
+async def delete_case(pool: asyncpg.Pool, case_id: uuid.UUID) -> bool:
     async with pool.acquire() as conn:
-        result = await conn.execute("DELETE FROM cases WHERE case_id = $1", uuid.UUID(case_id))
+        result = await conn.execute(_DELETE_CASE_SQL, case_id)
     return result == "DELETE 1"
 
 
@@ -119,31 +231,23 @@ async def delete_case(pool: asyncpg.Pool, case_id: str) -> bool:
 async def insert_transcript(
     pool: asyncpg.Pool,
     *,
-    conversation_id: str,
+    conversation_id: uuid.UUID,
     case_number: int,
     transcript: list[dict],
-) -> dict:
+    append: bool = False,
+) -> asyncpg.Record:
     async with pool.acquire() as conn:
         row = await conn.fetchrow(
-            """
-            INSERT INTO interview_transcripts (conversation_id, case_number, transcript)
-            VALUES ($1, $2, $3::jsonb)
-            ON CONFLICT (conversation_id) DO UPDATE
-                SET transcript = EXCLUDED.transcript,
-                    case_number = EXCLUDED.case_number
-            RETURNING *
-            """,
-            uuid.UUID(conversation_id),
+            _UPSERT_TRANSCRIPT_SQL,
+            conversation_id,
             case_number,
-            json.dumps(transcript),
+            transcript,
+            append,
         )
-    return dict(row)
+    return row
 
 
-async def list_transcripts_by_case(pool: asyncpg.Pool, case_number: int) -> list[dict]:
+async def list_transcripts_by_case(pool: asyncpg.Pool, case_number: int) -> list[asyncpg.Record]:
     async with pool.acquire() as conn:
-        rows = await conn.fetch(
-            "SELECT * FROM interview_transcripts WHERE case_number = $1 ORDER BY created_at DESC",
-            case_number,
-        )
-    return [dict(r) for r in rows]
+        rows = await conn.fetch(_LIST_TRANSCRIPTS_SQL, case_number)
+    return rows
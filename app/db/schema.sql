@@ -17,7 +17,11 @@ END $$;
 
 CREATE UNIQUE INDEX IF NOT EXISTS idx_cases_case_number ON cases (case_number);
 
-CREATE INDEX IF NOT EXISTS idx_cases_specialty ON cases (specialty);
+-- list_cases filters by specialty and always orders by created_at DESC;
+-- the composite index also serves plain specialty lookups.
+DROP INDEX IF EXISTS idx_cases_specialty;
+CREATE INDEX IF NOT EXISTS idx_cases_specialty_created ON cases (specialty, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_cases_created ON cases (created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_cases_difficulty ON cases (difficulty);
 CREATE INDEX IF NOT EXISTS idx_cases_data_gin ON cases USING GIN (case_data);
 
@@ -2,20 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import hashlib
-import json
 import logging
 import uuid
-from datetime import datetime, timezone
+from collections import Counter
 from typing import Literal
 
 import anthropic
 import openai
+import orjson
 import redis.asyncio as redis
 from pydantic import BaseModel, Field
 
 from app.config import settings
-from app.evaluation.prompts import SYSTEM_PROMPT, build_evaluation_prompt
+from app.evaluation.prompts import build_evaluation_prompt, build_system_prompt
 from app.evaluation.rubrics import get_rubric
 from app.evaluation.schemas import (
     DimensionScore,
@@ -29,10 +31,32 @@ logger = logging.getLogger(__name__)
 
 EVAL_CACHE_TTL = 3600  # 1 hour
 
+# Layers evaluated for each EvaluationRequest.layer value.
+_LAYERS: dict[str, tuple[str, ...]] = {
+    "case_fidelity": ("case_fidelity",),
+    "student_performance": ("student_performance",),
+    "both": ("case_fidelity", "student_performance"),
+}
+
+
+# ── Provider clients ─────────────────────────────────────────────────────────
+# One client per process, created on first use, so HTTP connections (and their
+# TLS sessions) are pooled across evaluations instead of rebuilt per call.
+
+
+@functools.cache
+def _anthropic_client() -> anthropic.AsyncAnthropic:
+    return anthropic.AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+
+
+@functools.cache
+def _openai_client() -> openai.AsyncOpenAI:
+    return openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+
 
 # ── Pydantic model for OpenAI structured output ─────────────────────────────
-# OpenAI's responses.parse API takes a Pydantic model directly and handles
-# the JSON schema generation (including additionalProperties: false).
+# The SDK's public pydantic_function_tool turns this into the strict JSON
+# schema (including additionalProperties: false) sent with each request.
 
 
 class EvidenceCitationOutput(BaseModel):
@@ -60,6 +84,16 @@ class EvaluationOutput(BaseModel):
     top_recommendation: str
 
 
+# Strict structured-output format, derived once; responses.parse would
+# regenerate it from EvaluationOutput on every judge call.
+_EVALUATION_TEXT_FORMAT = {
+    "type": "json_schema",
+    "name": "EvaluationOutput",
+    "schema": openai.pydantic_function_tool(EvaluationOutput)["function"]["parameters"],
+    "strict": True,
+}
+
+
 # ── Tool schema for Claude tool_use ──────────────────────────────────────────
 
 EVALUATION_TOOL = {
@@ -128,30 +162,33 @@ EVALUATION_TOOL = {
 
 def _cache_key(request: EvaluationRequest, layer: str) -> str:
     """Build a deterministic cache key from request contents."""
-    transcript_text = "|".join(
-        f"{t.turn_number}:{t.speaker}:{t.content}" for t in request.transcript.turns
-    )
-    raw = f"{request.case_description.model_dump_json()}|{transcript_text}|{layer}|{request.rubric_version or 'default'}"
-    return f"eval:{hashlib.sha256(raw.encode()).hexdigest()}"
-
-
-async def _get_cached(r: redis.Redis | None, key: str) -> dict | None:
+    raw = orjson.dumps([
+        request.case_description.model_dump(mode="json"),
+        request.transcript.model_dump(mode="json", include={"turns"}),
+        layer,
+        request.rubric_version or "default",
+        request.model,
+    ])
+    return f"eval:{hashlib.blake2b(raw, digest_size=16).hexdigest()}"
+
+
+async def _get_cached_many(r: redis.Redis | None, keys: list[str]) -> list[dict | None]:
+    """Fetch several cached layer results in one MGET round-trip."""
     if r is None:
-        return None
+        return [None] * len(keys)
     try:
-        raw = await r.get(key)
-        if raw:
-            return json.loads(raw)
+        raws = await r.mget(keys)
+        return [orjson.loads(raw) if raw else None for raw in raws]
     except Exception:
         logger.warning("Redis cache read failed", exc_info=True)
-    return None
+    return [None] * len(keys)
 
 
 async def _set_cached(r: redis.Redis | None, key: str, data: dict) -> None:
     if r is None:
         return
     try:
-        await r.set(key, json.dumps(data, default=str), ex=EVAL_CACHE_TTL)
+        await r.set(key, orjson.dumps(data), ex=EVAL_CACHE_TTL)
     except Exception:
         logger.warning("Redis cache write failed", exc_info=True)
 
@@ -185,15 +222,15 @@ def _parse_tool_result(tool_input: dict, layer: str) -> EvaluationResult:
 
 
 async def _evaluate_with_claude(
-    prompt: str, layer: str
+    system_prompt: str, prompt: str, layer: str
 ) -> tuple[EvaluationResult, dict]:
     """Call Anthropic Claude with tool_use for structured output."""
-    client = anthropic.AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
-
-    response = await client.messages.create(
+    response = await _anthropic_client().messages.create(
         model="claude-sonnet-4-20250514",
         max_tokens=4096,
-        system=SYSTEM_PROMPT,
+        # Tools + system (instructions and rubric) form a stable prefix;
+        # mark it so repeat evaluations read it from the prompt cache.
+        system=[{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}],
         tools=[EVALUATION_TOOL],
         tool_choice={"type": "tool", "name": "submit_evaluation"},
         messages=[{"role": "user", "content": prompt}],
@@ -214,21 +251,22 @@ async def _evaluate_with_claude(
 
 
 async def _evaluate_with_gpt4o(
-    prompt: str, layer: str
+    system_prompt: str, prompt: str, layer: str
 ) -> tuple[EvaluationResult, dict]:
-    """Fallback: call OpenAI GPT-4o with responses.parse for structured output."""
-    client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-
-    response = await client.responses.parse(
+    """Fallback: call OpenAI GPT-4o via responses.create with a strict JSON-schema format."""
+    response = await _openai_client().responses.create(
         model=settings.OPENAI_MODEL,
-        instructions=SYSTEM_PROMPT,
+        instructions=system_prompt,
         input=[{"role": "user", "content": prompt}],
-        text_format=EvaluationOutput,
+        text={"format": _EVALUATION_TEXT_FORMAT},
+        # OpenAI caches shared prefixes automatically; the key routes
+        # requests for the same rubric to the same cache.
+        prompt_cache_key=f"eval:{layer}:{get_rubric(layer)['version']}",
     )
 
-    parsed = response.output_parsed
-    if parsed is None:
+    if not response.output_text:
         raise ValueError("GPT-4o returned empty parsed response")
+    parsed = EvaluationOutput.model_validate_json(response.output_text)
 
     token_usage = {
         "input_tokens": response.usage.input_tokens if response.usage else 0,
@@ -239,40 +277,42 @@ async def _evaluate_with_gpt4o(
     return result, token_usage
 
 
+# Judge implementations by EvaluationRequest.model, and the model each one
+# falls back to when its provider call fails.
+_JUDGES = {"claude": _evaluate_with_claude, "gpt-4o": _evaluate_with_gpt4o}
+_FALLBACK_MODEL = {"claude": "gpt-4o"}
+
+
 async def _evaluate_single_layer(
     request: EvaluationRequest,
     layer: str,
+    cache_key: str,
+    cached: dict | None,
     r: redis.Redis | None = None,
-) -> tuple[EvaluationResult, str, dict]:
-    """Evaluate a single layer, with caching and fallback."""
-    cache_key = _cache_key(request, layer)
+) -> tuple[EvaluationResult, str, dict, bool]:
+    """Evaluate a single layer, with caching and fallback.
 
-    # Check cache
-    cached = await _get_cached(r, cache_key)
+    *cached* is the layer's prefetched cache entry, if any. The last element
+    reports whether the result came from the cache.
+    """
     if cached:
         logger.info("Cache hit for %s", cache_key)
         result = EvaluationResult(**cached["result"])
-        return result, cached["model_used"], cached.get("token_usage", {})
+        return result, cached["model_used"], cached.get("token_usage", {}), True
 
-    rubric = get_rubric(layer)
-    prompt = build_evaluation_prompt(
-        request.case_description, request.transcript, rubric, layer
-    )
+    system_prompt = build_system_prompt(get_rubric(layer))
+    prompt = build_evaluation_prompt(request.case_description, request.transcript, layer)
 
     model_used = request.model
-    token_usage: dict = {}
-
-    if model_used == "claude":
-        try:
-            result, token_usage = await _evaluate_with_claude(prompt, layer)
-            model_used = "claude"
-        except Exception:
-            logger.warning("Claude evaluation failed, falling back to GPT-4o", exc_info=True)
-            result, token_usage = await _evaluate_with_gpt4o(prompt, layer)
-            model_used = "gpt-4o"
-    else:
-        result, token_usage = await _evaluate_with_gpt4o(prompt, layer)
-        model_used = "gpt-4o"
+    try:
+        result, token_usage = await _JUDGES[model_used](system_prompt, prompt, layer)
+    except Exception:
+        fallback = _FALLBACK_MODEL.get(model_used)
+        if fallback is None:
+            raise
+        logger.warning("%s evaluation failed, falling back to %s", model_used, fallback, exc_info=True)
+        model_used = fallback
+        result, token_usage = await _JUDGES[model_used](system_prompt, prompt, layer)
 
     # Cache the result
     await _set_cached(
@@ -285,7 +325,7 @@ async def _evaluate_single_layer(
         },
     )
 
-    return result, model_used, token_usage
+    return result, model_used, token_usage, False
 
 
 async def evaluate_transcript(
@@ -293,27 +333,29 @@ async def evaluate_transcript(
     r: redis.Redis | None = None,
 ) -> EvaluationResponse:
     """Main entry point: evaluate a transcript against a case on one or both layers."""
-    layers: list[str] = []
-    if request.layer == "both":
-        layers = ["case_fidelity", "student_performance"]
-    else:
-        layers = [request.layer]
-
-    results: list[EvaluationResult] = []
-    total_tokens: dict = {"input_tokens": 0, "output_tokens": 0}
-    model_used = ""
-
-    for layer in layers:
-        result, used_model, tokens = await _evaluate_single_layer(request, layer, r)
-        results.append(result)
-        model_used = used_model
-        total_tokens["input_tokens"] += tokens.get("input_tokens", 0)
-        total_tokens["output_tokens"] += tokens.get("output_tokens", 0)
+    layers = _LAYERS[request.layer]
+    cache_keys = [_cache_key(request, layer) for layer in layers]
+    cached = await _get_cached_many(r, cache_keys)
+
+    # Layers are independent, so "both" runs its two judge calls concurrently.
+    outcomes = await asyncio.gather(
+        *(
+            _evaluate_single_layer(request, layer, key, hit, r)
+            for layer, key, hit in zip(layers, cache_keys, cached)
+        )
+    )
+
+    results = [result for result, _, _, _ in outcomes]
+    model_used = outcomes[-1][1]
+    total_tokens = Counter({"input_tokens": 0, "output_tokens": 0})
+    for _, _, tokens, _ in outcomes:
+        total_tokens.update(tokens)
+    cache_hit = all(hit for _, _, _, hit in outcomes)
 
     return EvaluationResponse(
         results=results,
         model_used=model_used,
-        timestamp=datetime.now(timezone.utc),
-        token_usage=total_tokens,
-        evaluation_id=str(uuid.uuid4()),
+        token_usage=dict(total_tokens),
+        evaluation_id=uuid.uuid4(),
+        cache_hit=cache_hit,
     )
@@ -7,10 +7,7 @@ from app.evaluation.schemas import CaseDescription, Transcript
 
 def _format_transcript(transcript: Transcript) -> str:
     """Format transcript turns into readable text."""
-    lines = []
-    for turn in transcript.turns:
-        lines.append(f"[Turn {turn.turn_number}] {turn.speaker}: {turn.content}")
-    return "\n".join(lines)
+    return "\n".join(f"[Turn {t.turn_number}] {t.speaker}: {t.content}" for t in transcript.turns)
 
 
 def _format_rubric_dimensions(dimensions: list[dict]) -> str:
@@ -31,49 +28,37 @@ def _format_rubric_dimensions(dimensions: list[dict]) -> str:
     return "\n".join(parts)
 
 
+def _fmt_kv_section(tag: str, d: dict) -> str:
+    entries = "\n".join(f"  <{k}>{v}</{k}>" for k, v in d.items())
+    return f"<{tag}>\n{entries}\n</{tag}>"
+
+
+def _fmt_list_section(tag: str, items: list[str], sep: str = ", ") -> str:
+    return f"<{tag}>{sep.join(items)}</{tag}>"
+
+
 def _format_case_description(case: CaseDescription) -> str:
     """Format case description into XML."""
-    sections = []
-    if case.demographics:
-        demo_lines = [f"  <{k}>{v}</{k}>" for k, v in case.demographics.items()]
-        sections.append(f"<demographics>\n{''.join(demo_lines)}\n</demographics>")
-    if case.chief_complaint:
-        sections.append(f"<chief_complaint>{case.chief_complaint}</chief_complaint>")
-    if case.hpi:
-        sections.append(f"<hpi>{case.hpi}</hpi>")
-    if case.pmh:
-        sections.append(f"<past_medical_history>{', '.join(case.pmh)}</past_medical_history>")
-    if case.medications:
-        sections.append(f"<medications>{', '.join(case.medications)}</medications>")
-    if case.allergies:
-        sections.append(f"<allergies>{', '.join(case.allergies)}</allergies>")
-    if case.social_history:
-        sh_lines = [f"  <{k}>{v}</{k}>" for k, v in case.social_history.items()]
-        sections.append(f"<social_history>\n{''.join(sh_lines)}\n</social_history>")
-    if case.family_history:
-        sections.append(f"<family_history>{', '.join(case.family_history)}</family_history>")
-    if case.ros:
-        ros_lines = [f"  <{k}>{v}</{k}>" for k, v in case.ros.items()]
-        sections.append(f"<review_of_systems>\n{''.join(ros_lines)}\n</review_of_systems>")
-    if case.physical_exam_findings:
-        pe_lines = [f"  <{k}>{v}</{k}>" for k, v in case.physical_exam_findings.items()]
-        sections.append(f"<physical_exam>\n{''.join(pe_lines)}\n</physical_exam>")
-    if case.labs:
-        lab_lines = [f"  <{k}>{v}</{k}>" for k, v in case.labs.items()]
-        sections.append(f"<labs>\n{''.join(lab_lines)}\n</labs>")
-    if case.imaging:
-        sections.append(f"<imaging>{', '.join(case.imaging)}</imaging>")
-    if case.differential_diagnosis:
-        sections.append(
-            f"<differential_diagnosis>{', '.join(case.differential_diagnosis)}</differential_diagnosis>"
-        )
-    if case.final_diagnosis:
-        sections.append(f"<final_diagnosis>{case.final_diagnosis}</final_diagnosis>")
-    if case.emotional_presentation:
-        sections.append(
-            f"<emotional_presentation>{case.emotional_presentation}</emotional_presentation>"
-        )
-    return "\n".join(sections)
+    sections = (
+        case.demographics and _fmt_kv_section("demographics", case.demographics),
+        case.chief_complaint and f"<chief_complaint>{case.chief_complaint}</chief_complaint>",
+        case.hpi and f"<hpi>{case.hpi}</hpi>",
+        case.pmh and _fmt_list_section("past_medical_history", case.pmh),
+        case.medications and _fmt_list_section("medications", case.medications),
+        case.allergies and _fmt_list_section("allergies", case.allergies),
+        case.social_history and _fmt_kv_section("social_history", case.social_history),
+        case.family_history and _fmt_list_section("family_history", case.family_history),
+        case.ros and _fmt_kv_section("review_of_systems", case.ros),
+        case.physical_exam_findings and _fmt_kv_section("physical_exam", case.physical_exam_findings),
+        case.labs and _fmt_kv_section("labs", case.labs),
+        case.imaging and _fmt_list_section("imaging", case.imaging),
+        case.differential_diagnosis
+        and _fmt_list_section("differential_diagnosis", case.differential_diagnosis),
+        case.final_diagnosis and f"<final_diagnosis>{case.final_diagnosis}</final_diagnosis>",
+        case.emotional_presentation
+        and f"<emotional_presentation>{case.emotional_presentation}</emotional_presentation>",
+    )
+    return "\n".join(filter(None, sections))
 
 
 SYSTEM_PROMPT = """You are an expert medical education evaluator acting as an impartial judge. \
@@ -90,41 +75,39 @@ and 5 for genuinely excellent performance.
 7. Provide actionable feedback in growth_areas — be specific about what could improve."""
 
 
-def build_evaluation_prompt(
-    case: CaseDescription,
-    transcript: Transcript,
-    rubric: dict,
-    layer: str,
-) -> str:
-    """Assemble the full LLM-as-judge prompt using XML tags."""
+# Rubrics are static, so each system prompt is rendered once per rubric
+# (name, version); clear this if rubrics are ever edited at runtime.
+_system_prompt_cache: dict[tuple[str, str], str] = {}
 
-    layer_description = (
-        "CASE FIDELITY: Evaluate how faithfully the simulated patient represents the case. "
-        "Does the patient stay accurate to the case description?"
-        if layer == "case_fidelity"
-        else "STUDENT PERFORMANCE: Evaluate the student's clinical reasoning, "
-        "history-gathering skills, and communication abilities."
-    )
 
-    return f"""<evaluation_task>
-<layer>{layer}</layer>
-<description>{layer_description}</description>
-</evaluation_task>
+def build_system_prompt(rubric: dict) -> str:
+    """Return the judge instructions followed by the rubric XML.
 
-<case_description>
-{_format_case_description(case)}
-</case_description>
+    The text is byte-identical for every call on the same rubric, so it is
+    sent as the cacheable prompt prefix for both providers.
+    """
+    key = (rubric["name"], rubric["version"])
+    prompt = _system_prompt_cache.get(key)
+    if prompt is None:
+        prompt = _system_prompt_cache[key] = (
+            f"{SYSTEM_PROMPT}\n\n<rubric>\n{_format_rubric_dimensions(rubric['dimensions'])}\n</rubric>"
+        )
+    return prompt
 
-<transcript>
-{_format_transcript(transcript)}
-</transcript>
 
-<rubric>
-{_format_rubric_dimensions(rubric['dimensions'])}
-</rubric>
+_LAYER_DESCRIPTIONS = {
+    "case_fidelity": (
+        "CASE FIDELITY: Evaluate how faithfully the simulated patient represents the case. "
+        "Does the patient stay accurate to the case description?"
+    ),
+    "student_performance": (
+        "STUDENT PERFORMANCE: Evaluate the student's clinical reasoning, "
+        "history-gathering skills, and communication abilities."
+    ),
+}
 
-<instructions>
-Evaluate the transcript against EACH dimension in the rubric above.
+_INSTRUCTIONS = """<instructions>
+Evaluate the transcript against EACH dimension in the rubric.
 
 For each dimension:
 1. Re-read the relevant parts of the transcript
@@ -138,3 +121,29 @@ After scoring all dimensions, compute the weighted total score and provide:
 - An overall summary paragraph
 - Your single top recommendation for improvement
 </instructions>"""
+
+# Static skeleton of the judge prompt; None marks the per-request slots
+# (layer, layer description, case XML, transcript) filled in order.
+_PROMPT_PARTS = (
+    "<evaluation_task>\n<layer>", None, "</layer>\n<description>", None,
+    "</description>\n</evaluation_task>\n\n<case_description>\n", None,
+    "\n</case_description>\n\n<transcript>\n", None,
+    f"\n</transcript>\n\n{_INSTRUCTIONS}",
+)
+
+
+def build_evaluation_prompt(
+    case: CaseDescription,
+    transcript: Transcript,
+    layer: str,
+) -> str:
+    """Assemble the per-request LLM-as-judge prompt using XML tags.
+
+    The rubric lives in the system prompt (see ``build_system_prompt``).
+    """
+    parts = list(_PROMPT_PARTS)
+    parts[1] = layer
+    parts[3] = _LAYER_DESCRIPTIONS[layer]
+    parts[5] = _format_case_description(case)
+    parts[7] = _format_transcript(transcript)
+    return "".join(parts)
@@ -2,21 +2,59 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
+import logging
 import uuid
-from datetime import datetime, timezone
 
 import asyncpg
+import orjson
 import redis.asyncio as redis
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response
+from pydantic import TypeAdapter
 
 from app.api.deps import get_db_pool, get_redis
+from app.config import settings
 from app.evaluation.engine import evaluate_transcript
-from app.evaluation.rubrics import CASE_FIDELITY_RUBRIC, STUDENT_PERFORMANCE_RUBRIC
-from app.evaluation.schemas import EvaluationRequest, EvaluationResponse
+from app.evaluation.rubrics import RUBRICS
+from app.evaluation.schemas import EvaluationRequest, EvaluationResponse, EvaluationResult
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/evaluate", tags=["evaluation"])
 
+# One fixed statement text for all inserts, so each pooled connection
+# prepares it once and reuses the plan from asyncpg's statement cache.
+_INSERT_EVALUATION_SQL = """
+    INSERT INTO evaluations (evaluation_id, session_id, layer, result, model_used, token_usage, created_at)
+    VALUES ($1, $2, $3, $4::jsonb, $5, $6::jsonb, $7)
+"""
+
+# Serializes results straight to JSON bytes in pydantic-core, with no
+# intermediate list of dicts.
+_results_adapter = TypeAdapter(list[EvaluationResult])
+
+
+def _evaluation_row(body: EvaluationRequest, response: EvaluationResponse) -> tuple:
+    return (
+        response.evaluation_id,
+        body.transcript.session_id or "anonymous",
+        body.layer,
+        _results_adapter.dump_json(response.results),
+        response.model_used,
+        orjson.dumps(response.token_usage),
+        response.timestamp,
+    )
+
+
+async def _persist_evaluations(pool: asyncpg.Pool, rows: list[tuple]) -> None:
+    """Insert evaluation rows; runs as a background task after the response."""
+    try:
+        async with pool.acquire() as conn, conn.transaction():
+            await conn.executemany(_INSERT_EVALUATION_SQL, rows)
+    except Exception:
+        logger.exception("Failed to persist %d evaluation(s)", len(rows))
+
 
 # ── Evaluate ─────────────────────────────────────────────────────────────────
 
@@ -24,27 +62,17 @@ router = APIRouter(prefix="/api/v1/evaluate", tags=["evaluation"])
 @router.post("/", response_model=EvaluationResponse)
 async def run_evaluation(
     body: EvaluationRequest,
+    http_response: Response,
+    background_tasks: BackgroundTasks,
     pool: asyncpg.Pool = Depends(get_db_pool),
     r: redis.Redis = Depends(get_redis),
 ):
     """Evaluate a transcript against a case description."""
     response = await evaluate_transcript(body, r=r)
+    http_response.headers["X-Cache"] = "HIT" if response.cache_hit else "MISS"
 
-    # Persist to database
-    async with pool.acquire() as conn:
-        await conn.execute(
-            """
-            INSERT INTO evaluations (evaluation_id, session_id, layer, result, model_used, token_usage, created_at)
-            VALUES ($1, $2, $3, $4::jsonb, $5, $6::jsonb, $7)
-            """,
-            uuid.UUID(response.evaluation_id),
-            body.transcript.session_id or "anonymous",
-            body.layer,
-            json.dumps([r.model_dump(mode="json") for r in response.results]),
-            response.model_used,
-            json.dumps(response.token_usage),
-            datetime.now(timezone.utc),
-        )
+    # Persist after the response is sent; the client only waits on the judge.
+    background_tasks.add_task(_persist_evaluations, pool, [_evaluation_row(body, response)])
 
     return response
 
@@ -52,93 +80,94 @@ async def run_evaluation(
 @router.post("/batch", response_model=list[EvaluationResponse])
 async def run_batch_evaluation(
     bodies: list[EvaluationRequest],
+    background_tasks: BackgroundTasks,
     pool: asyncpg.Pool = Depends(get_db_pool),
     r: redis.Redis = Depends(get_redis),
 ):
     """Evaluate multiple transcripts against the same or different cases."""
-    results = []
-    for body in bodies:
-        response = await evaluate_transcript(body, r=r)
-
-        async with pool.acquire() as conn:
-            await conn.execute(
-                """
-                INSERT INTO evaluations (evaluation_id, session_id, layer, result, model_used, token_usage, created_at)
-                VALUES ($1, $2, $3, $4::jsonb, $5, $6::jsonb, $7)
-                """,
-                uuid.UUID(response.evaluation_id),
-                body.transcript.session_id or "anonymous",
-                body.layer,
-                json.dumps([r.model_dump(mode="json") for r in response.results]),
-                response.model_used,
-                json.dumps(response.token_usage),
-                datetime.now(timezone.utc),
-            )
-
-        results.append(response)
+    # Judge calls dominate latency, so run them concurrently — capped to
+    # stay inside provider rate limits.
+    sem = asyncio.Semaphore(settings.JUDGE_CONCURRENCY)
+
+    async def _evaluate(body: EvaluationRequest) -> EvaluationResponse:
+        async with sem:
+            return await evaluate_transcript(body, r=r)
+
+    results = await asyncio.gather(*(_evaluate(body) for body in bodies))
+
+    rows = [_evaluation_row(body, response) for body, response in zip(bodies, results)]
+    background_tasks.add_task(_persist_evaluations, pool, rows)
+
     return results
 
 
 @router.get("/{evaluation_id}", response_model=EvaluationResponse)
 async def get_evaluation(
-    evaluation_id: str,
+    evaluation_id: uuid.UUID,
     pool: asyncpg.Pool = Depends(get_db_pool),
 ):
     """Retrieve a stored evaluation by ID."""
     async with pool.acquire() as conn:
         row = await conn.fetchrow(
             "SELECT * FROM evaluations WHERE evaluation_id = $1",
-            uuid.UUID(evaluation_id),
+            evaluation_id,
         )
     if not row:
         raise HTTPException(status_code=404, detail="Evaluation not found")
 
-    result_data = row["result"]
-    if isinstance(result_data, str):
-        result_data = json.loads(result_data)
-
-    token_usage = row["token_usage"]
-    if isinstance(token_usage, str):
-        token_usage = json.loads(token_usage)
-
+    # jsonb columns arrive already decoded by the pool's codec.
     return EvaluationResponse(
-        results=result_data,
+        results=row["result"],
         model_used=row["model_used"],
         timestamp=row["created_at"],
-        token_usage=token_usage,
-        evaluation_id=str(row["evaluation_id"]),
+        token_usage=row["token_usage"],
+        evaluation_id=row["evaluation_id"],
     )
 
 
 # ── Rubrics ──────────────────────────────────────────────────────────────────
 
 
+# Rubrics are static for the life of the process, so their response bodies
+# and ETags are built once. Anchor keys are ints, hence OPT_NON_STR_KEYS.
+
+
+def _static_json(data) -> tuple[bytes, str]:
+    body = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+_RUBRICS_LIST = _static_json({
+    "rubrics": [
+        {
+            "name": rubric["name"],
+            "layer": rubric["layer"],
+            "version": rubric["version"],
+            "dimension_count": len(rubric["dimensions"]),
+        }
+        for rubric in RUBRICS.values()
+    ]
+})
+_RUBRIC_DETAILS = {layer: _static_json(rubric) for layer, rubric in RUBRICS.items()}
+
+
+def _static_response(request: Request, body: bytes, etag: str) -> Response:
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.get("/rubrics/list")
-async def list_rubrics():
+async def list_rubrics(request: Request):
     """List available rubric definitions."""
-    return {
-        "rubrics": [
-            {
-                "name": CASE_FIDELITY_RUBRIC["name"],
-                "layer": CASE_FIDELITY_RUBRIC["layer"],
-                "version": CASE_FIDELITY_RUBRIC["version"],
-                "dimension_count": len(CASE_FIDELITY_RUBRIC["dimensions"]),
-            },
-            {
-                "name": STUDENT_PERFORMANCE_RUBRIC["name"],
-                "layer": STUDENT_PERFORMANCE_RUBRIC["layer"],
-                "version": STUDENT_PERFORMANCE_RUBRIC["version"],
-                "dimension_count": len(STUDENT_PERFORMANCE_RUBRIC["dimensions"]),
-            },
-        ]
-    }
+    return _static_response(request, *_RUBRICS_LIST)
 
 
 @router.get("/rubrics/{layer}")
-async def get_rubric_detail(layer: str):
+async def get_rubric_detail(layer: str, request: Request):
     """Get full rubric definition for a layer."""
-    if layer == "case_fidelity":
-        return CASE_FIDELITY_RUBRIC
-    if layer == "student_performance":
-        return STUDENT_PERFORMANCE_RUBRIC
-    raise HTTPException(status_code=404, detail=f"Unknown layer: {layer}")
+    detail = _RUBRIC_DETAILS.get(layer)
+    if detail is None:
+        raise HTTPException(status_code=404, detail=f"Unknown layer: {layer}")
+    return _static_response(request, *detail)
@@ -119,10 +119,15 @@ STUDENT_PERFORMANCE_RUBRIC: dict = {
 }
 
 
+RUBRICS: dict[str, dict] = {
+    CASE_FIDELITY_RUBRIC["layer"]: CASE_FIDELITY_RUBRIC,
+    STUDENT_PERFORMANCE_RUBRIC["layer"]: STUDENT_PERFORMANCE_RUBRIC,
+}
+
+
 def get_rubric(layer: str) -> dict:
     """Return the default rubric for the given evaluation layer."""
-    if layer == "case_fidelity":
-        return CASE_FIDELITY_RUBRIC
-    if layer == "student_performance":
-        return STUDENT_PERFORMANCE_RUBRIC
-    raise ValueError(f"Unknown layer: {layer}")
+    rubric = RUBRICS.get(layer)
+    if rubric is None:
+        raise ValueError(f"Unknown layer: {layer}")
+    return rubric
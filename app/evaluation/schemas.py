@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import uuid
+from datetime import datetime, timezone
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ── Input Models ─────────────────────────────────────────────────────────────
@@ -14,6 +15,8 @@ from pydantic import BaseModel, Field
 class CaseDescription(BaseModel):
     """Structured case description for evaluation context."""
 
+    model_config = ConfigDict(frozen=True)
+
     demographics: dict = Field(default_factory=dict)
     chief_complaint: str = ""
     hpi: str = ""
@@ -34,6 +37,8 @@ class CaseDescription(BaseModel):
 class TranscriptTurn(BaseModel):
     """A single turn in the student-patient conversation."""
 
+    model_config = ConfigDict(frozen=True)
+
     turn_number: int = Field(ge=1)
     speaker: Literal["Student", "Patient"]
     content: str
@@ -42,6 +47,8 @@ class TranscriptTurn(BaseModel):
 class Transcript(BaseModel):
     """Full conversation transcript with metadata."""
 
+    model_config = ConfigDict(frozen=True)
+
     turns: list[TranscriptTurn]
     session_id: str | None = None
     timestamp: datetime | None = None
@@ -53,6 +60,8 @@ class Transcript(BaseModel):
 class EvidenceCitation(BaseModel):
     """A reference to a specific transcript turn supporting a score."""
 
+    model_config = ConfigDict(frozen=True)
+
     turn_number: int = Field(description="Transcript turn number")
     speaker: Literal["Student", "Patient"]
     quote: str = Field(description="Relevant excerpt from that turn")
@@ -62,6 +71,8 @@ class EvidenceCitation(BaseModel):
 class DimensionScore(BaseModel):
     """Score and rationale for a single evaluation dimension."""
 
+    model_config = ConfigDict(frozen=True)
+
     dimension: str
     score: int = Field(ge=1, le=5)
     weight: float
@@ -74,6 +85,8 @@ class DimensionScore(BaseModel):
 class EvaluationResult(BaseModel):
     """Complete evaluation for one layer."""
 
+    model_config = ConfigDict(frozen=True)
+
     layer: Literal["case_fidelity", "student_performance"]
     dimensions: list[DimensionScore]
     weighted_total: float
@@ -87,6 +100,8 @@ class EvaluationResult(BaseModel):
 class EvaluationRequest(BaseModel):
     """Request to evaluate a transcript against a case."""
 
+    model_config = ConfigDict(frozen=True)
+
     case_description: CaseDescription
     transcript: Transcript
     layer: Literal["case_fidelity", "student_performance", "both"] = "both"
@@ -97,8 +112,12 @@ class EvaluationRequest(BaseModel):
 class EvaluationResponse(BaseModel):
     """Response containing evaluation results."""
 
+    model_config = ConfigDict(frozen=True)
+
     results: list[EvaluationResult]
     model_used: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     token_usage: dict = Field(default_factory=dict)
-    evaluation_id: str | None = None
+    evaluation_id: uuid.UUID | None = None
+    # Whether every layer was served from the result cache; not serialized.
+    cache_hit: bool = Field(default=False, exclude=True)
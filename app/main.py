@@ -5,7 +5,7 @@ from __future__ import annotations
 from contextlib import asynccontextmanager
 
 import redis.asyncio as redis
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.cases import router as cases_router
@@ -14,6 +14,7 @@ from app.evaluation.router import router as evaluation_router
 from app.config import settings
 from app.db.connection import close_pool, create_pool
 from app.db.queries import init_schema
+from app.schemas import HealthResponse
 
 
 @asynccontextmanager
@@ -36,14 +37,32 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Streamlit frontends call the API server-side, so CORS only matters for
+# browser clients explicitly listed in CORS_ORIGINS.
+if settings.CORS_ORIGINS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
 app.include_router(cases_router)
 app.include_router(transcripts_router)
 app.include_router(evaluation_router)
+
+
+@app.get("/health", response_model=HealthResponse, tags=["health"])
+async def health(request: Request):
+    """Liveness check with connection pool occupancy."""
+    pool = request.app.state.db_pool
+    return {
+        "status": "ok",
+        "db_pool": {
+            "size": pool.get_size(),
+            "idle": pool.get_idle_size(),
+            "min": pool.get_min_size(),
+            "max": pool.get_max_size(),
+        },
+    }
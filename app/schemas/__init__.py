@@ -5,6 +5,8 @@ from app.schemas.api_models import (
     CaseGenerateRequest,
     CaseListResponse,
     CaseUpdateRequest,
+    HealthResponse,
+    PoolStats,
     TranscriptSaveRequest,
     TranscriptSaveResponse,
 )
@@ -16,7 +18,9 @@ __all__ = [
     "CaseListResponse",
     "CaseUpdateRequest",
     "Difficulty",
+    "HealthResponse",
     "MedicalCase",
+    "PoolStats",
     "TranscriptSaveRequest",
     "TranscriptSaveResponse",
 ]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import uuid
+
 from pydantic import BaseModel, Field
 
 from app.schemas.medical_case import Difficulty, MedicalCase
@@ -44,12 +46,28 @@ class CaseListResponse(BaseModel):
 
 
 class TranscriptSaveRequest(BaseModel):
-    conversation_id: str
+    conversation_id: uuid.UUID
     case_number: int
     transcript: list[dict]
+    append: bool = False  # extend the stored transcript instead of replacing it
 
 
 class TranscriptSaveResponse(BaseModel):
     conversation_id: str
     case_number: int
     created_at: str
+
+
+# ── Health models ────────────────────────────────────────────────────────────
+
+
+class PoolStats(BaseModel):
+    size: int
+    idle: int
+    min: int
+    max: int
+
+
+class HealthResponse(BaseModel):
+    status: str
+    db_pool: PoolStats
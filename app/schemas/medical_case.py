@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import sys
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
+from typing import Annotated
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, field_validator
 
 
 # ── Enums ──────────────────────────────────────────────────────────────────────
@@ -45,9 +47,37 @@ class ManagementCategory(str, Enum):
     OTHER = "other"
 
 
+# Shared by every model below. These are pydantic's defaults spelled out so the
+# fast path is pinned: unknown keys dropped, no alias lookup, no whitespace
+# stripping and no re-validation on assignment.
+_MODEL_CONFIG = ConfigDict(
+    extra="ignore",
+    populate_by_name=False,
+    validate_assignment=False,
+    str_strip_whitespace=False,
+    arbitrary_types_allowed=False,
+)
+
+
+# Low-cardinality vocabulary (organ systems, relations, routes, modalities)
+# repeats across every cached case; interning keeps one string per value.
+_Vocab = Annotated[str, AfterValidator(sys.intern)]
+
+
+class _CaseSection(BaseModel):
+    """Base for nested case sections.
+
+    Sections are validated through MedicalCase's schema, so their standalone
+    validators are only built if a section is used on its own. They are
+    immutable value objects; edits go through the API as case_data patches.
+    """
+
+    model_config = ConfigDict(**_MODEL_CONFIG, defer_build=True, frozen=True)
+
+
 # ── Demographics & Vitals ──────────────────────────────────────────────────────
 
-class PatientDemographics(BaseModel):
+class PatientDemographics(_CaseSection):
     age: int = Field(..., ge=0, le=150)
     sex: Sex
     weight_kg: float | None = Field(None, ge=0)
@@ -57,7 +87,7 @@ class PatientDemographics(BaseModel):
     preferred_language: str | None = None
 
 
-class VitalSigns(BaseModel):
+class VitalSigns(_CaseSection):
     heart_rate: int | None = Field(None, ge=0, le=300)
     bp_systolic: int | None = Field(None, ge=0, le=350)
     bp_diastolic: int | None = Field(None, ge=0, le=250)
@@ -70,7 +100,7 @@ class VitalSigns(BaseModel):
 
 # ── History ────────────────────────────────────────────────────────────────────
 
-class ChiefComplaintHPI(BaseModel):
+class ChiefComplaintHPI(_CaseSection):
     chief_complaint: str
     hpi_narrative: str
     onset: str | None = None
@@ -81,28 +111,28 @@ class ChiefComplaintHPI(BaseModel):
     associated_symptoms: list[str] = Field(default_factory=list)
 
 
-class SystemReview(BaseModel):
-    system: str
+class SystemReview(_CaseSection):
+    system: _Vocab
     positive_findings: list[str] = Field(default_factory=list)
     negative_findings: list[str] = Field(default_factory=list)
 
 
-class PastMedicalHistory(BaseModel):
+class PastMedicalHistory(_CaseSection):
     conditions: list[str] = Field(default_factory=list)
     hospitalizations: list[str] = Field(default_factory=list)
 
 
-class PastSurgicalHistory(BaseModel):
+class PastSurgicalHistory(_CaseSection):
     surgeries: list[str] = Field(default_factory=list)
 
 
-class FamilyMember(BaseModel):
-    relation: str
+class FamilyMember(_CaseSection):
+    relation: _Vocab
     conditions: list[str] = Field(default_factory=list)
     alive: bool | None = None
 
 
-class SocialHistory(BaseModel):
+class SocialHistory(_CaseSection):
     tobacco: str | None = None
     alcohol: str | None = None
     drugs: str | None = None
@@ -111,14 +141,14 @@ class SocialHistory(BaseModel):
     exercise: str | None = None
 
 
-class Medication(BaseModel):
+class Medication(_CaseSection):
     name: str
     dose: str | None = None
-    route: str | None = None
-    frequency: str | None = None
+    route: _Vocab | None = None
+    frequency: _Vocab | None = None
 
 
-class Allergy(BaseModel):
+class Allergy(_CaseSection):
     substance: str
     reaction: str | None = None
     severity: AllergyServerity | None = None
@@ -126,7 +156,7 @@ class Allergy(BaseModel):
 
 # ── Physical Exam ──────────────────────────────────────────────────────────────
 
-class HEENTExam(BaseModel):
+class HEENTExam(_CaseSection):
     head: str | None = None
     eyes: str | None = None
     ears: str | None = None
@@ -134,7 +164,7 @@ class HEENTExam(BaseModel):
     throat: str | None = None
 
 
-class CardiovascularExam(BaseModel):
+class CardiovascularExam(_CaseSection):
     rate_rhythm: str | None = None
     murmurs: str | None = None
     jvd: str | None = None
@@ -142,7 +172,7 @@ class CardiovascularExam(BaseModel):
     edema: str | None = None
 
 
-class PulmonaryExam(BaseModel):
+class PulmonaryExam(_CaseSection):
     effort: str | None = None
     breath_sounds: str | None = None
     wheezes: str | None = None
@@ -150,7 +180,7 @@ class PulmonaryExam(BaseModel):
     rhonchi: str | None = None
 
 
-class AbdominalExam(BaseModel):
+class AbdominalExam(_CaseSection):
     inspection: str | None = None
     bowel_sounds: str | None = None
     tenderness: str | None = None
@@ -158,7 +188,7 @@ class AbdominalExam(BaseModel):
     rebound: bool | None = None
 
 
-class NeurologicalExam(BaseModel):
+class NeurologicalExam(_CaseSection):
     mental_status: str | None = None
     cranial_nerves: str | None = None
     motor: str | None = None
@@ -168,21 +198,21 @@ class NeurologicalExam(BaseModel):
     gait: str | None = None
 
 
-class MusculoskeletalExam(BaseModel):
+class MusculoskeletalExam(_CaseSection):
     inspection: str | None = None
     range_of_motion: str | None = None
     strength: str | None = None
     swelling: str | None = None
 
 
-class SkinExam(BaseModel):
+class SkinExam(_CaseSection):
     color: str | None = None
     turgor: str | None = None
     lesions: str | None = None
     rashes: str | None = None
 
 
-class PsychiatricExam(BaseModel):
+class PsychiatricExam(_CaseSection):
     appearance: str | None = None
     behavior: str | None = None
     mood: str | None = None
@@ -191,7 +221,7 @@ class PsychiatricExam(BaseModel):
     thought_content: str | None = None
 
 
-class PhysicalExam(BaseModel):
+class PhysicalExam(_CaseSection):
     general_appearance: str | None = None
     heent: HEENTExam | None = None
     cardiovascular: CardiovascularExam | None = None
@@ -205,7 +235,7 @@ class PhysicalExam(BaseModel):
 
 # ── Diagnostics ────────────────────────────────────────────────────────────────
 
-class CBC(BaseModel):
+class CBC(_CaseSection):
     wbc: float | None = None
     hemoglobin: float | None = None
     hematocrit: float | None = None
@@ -214,7 +244,7 @@ class CBC(BaseModel):
     rdw: float | None = None
 
 
-class BMP(BaseModel):
+class BMP(_CaseSection):
     sodium: float | None = None
     potassium: float | None = None
     chloride: float | None = None
@@ -225,7 +255,7 @@ class BMP(BaseModel):
     calcium: float | None = None
 
 
-class HepaticPanel(BaseModel):
+class HepaticPanel(_CaseSection):
     ast: float | None = None
     alt: float | None = None
     alp: float | None = None
@@ -235,13 +265,13 @@ class HepaticPanel(BaseModel):
     total_protein: float | None = None
 
 
-class Coagulation(BaseModel):
+class Coagulation(_CaseSection):
     pt: float | None = None
     inr: float | None = None
     ptt: float | None = None
 
 
-class Urinalysis(BaseModel):
+class Urinalysis(_CaseSection):
     color: str | None = None
     clarity: str | None = None
     specific_gravity: float | None = None
@@ -256,20 +286,20 @@ class Urinalysis(BaseModel):
     bacteria: str | None = None
 
 
-class CardiacMarkers(BaseModel):
+class CardiacMarkers(_CaseSection):
     troponin: float | None = None
     bnp: float | None = None
     ck_mb: float | None = None
 
 
-class MiscLab(BaseModel):
+class MiscLab(_CaseSection):
     name: str
     value: str
     unit: str | None = None
     reference_range: str | None = None
 
 
-class LabResults(BaseModel):
+class LabResults(_CaseSection):
     cbc: CBC | None = None
     bmp: BMP | None = None
     hepatic_panel: HepaticPanel | None = None
@@ -279,15 +309,15 @@ class LabResults(BaseModel):
     misc_labs: list[MiscLab] = Field(default_factory=list)
 
 
-class ImagingStudy(BaseModel):
-    modality: str
+class ImagingStudy(_CaseSection):
+    modality: _Vocab
     body_part: str
     contrast: bool = False
     findings: str | None = None
     impression: str | None = None
 
 
-class Diagnostics(BaseModel):
+class Diagnostics(_CaseSection):
     lab_results: LabResults | None = None
     imaging: list[ImagingStudy] = Field(default_factory=list)
     other_studies: list[str] = Field(default_factory=list)
@@ -295,26 +325,26 @@ class Diagnostics(BaseModel):
 
 # ── Assessment & Plan ──────────────────────────────────────────────────────────
 
-class DifferentialDiagnosis(BaseModel):
+class DifferentialDiagnosis(_CaseSection):
     rank: int = Field(..., ge=1)
     diagnosis: str
     reasoning: str | None = None
 
 
-class Assessment(BaseModel):
+class Assessment(_CaseSection):
     differential_diagnoses: list[DifferentialDiagnosis] = Field(default_factory=list)
     working_diagnosis: str | None = None
     final_diagnosis: str | None = None
     clinical_reasoning: str | None = None
 
 
-class ManagementStep(BaseModel):
+class ManagementStep(_CaseSection):
     category: ManagementCategory
     description: str
     priority: PriorityLevel = PriorityLevel.ROUTINE
 
 
-class Plan(BaseModel):
+class Plan(_CaseSection):
     steps: list[ManagementStep] = Field(default_factory=list)
     disposition: str | None = None
     follow_up: str | None = None
@@ -323,14 +353,23 @@ class Plan(BaseModel):
 
 # ── Root Model ─────────────────────────────────────────────────────────────────
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class MedicalCase(BaseModel):
-    case_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    # Overrides stay cheap attribute/copy operations, and unknown keys in stored
+    # documents are dropped when a case is canonicalized for caching.
+    model_config = _MODEL_CONFIG
+
+    case_id: uuid.UUID = Field(default_factory=uuid.uuid4)
     case_number: int | None = None
     case_title: str = ""
     specialty: str = "general"
     difficulty: Difficulty = Difficulty.MEDIUM
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    # Only set by writes; stored cases always carry the column value.
+    updated_at: datetime | None = None
 
     demographics: PatientDemographics
     vitals: VitalSigns | None = None
@@ -347,15 +386,6 @@ class MedicalCase(BaseModel):
     assessment: Assessment | None = None
     plan: Plan | None = None
 
-    @field_validator("case_id", mode="before")
-    @classmethod
-    def ensure_uuid(cls, v: str) -> str:
-        try:
-            uuid.UUID(v)
-        except (ValueError, AttributeError):
-            return str(uuid.uuid4())
-        return v
-
     @field_validator("difficulty", mode="before")
     @classmethod
     def coerce_difficulty(cls, v):
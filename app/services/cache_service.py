@@ -2,23 +2,102 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
+import uuid
 
+import orjson
 import redis.asyncio as redis
 
 CASE_TTL_SECONDS = 3600  # 1 hour
+CASE_LIST_TTL_SECONDS = 60
 
+# Bumped on every case write; list page keys embed it, so stale pages simply
+# stop being addressed and age out via their TTL.
+CASES_VERSION_KEY = "cases:version"
 
-async def get_cached_case(r: redis.Redis, case_id: str) -> dict | None:
-    raw = await r.get(f"case:{case_id}")
-    if raw is None:
-        return None
-    return json.loads(raw)
 
+def _case_key(case_id: uuid.UUID | str) -> str:
+    return f"case:{case_id}"
 
-async def set_cached_case(r: redis.Redis, case_id: str, data: dict) -> None:
-    await r.set(f"case:{case_id}", json.dumps(data, default=str), ex=CASE_TTL_SECONDS)
 
+def _case_number_key(case_number: int) -> str:
+    return f"case:number:{case_number}"
 
-async def invalidate_case(r: redis.Redis, case_id: str) -> None:
-    await r.delete(f"case:{case_id}")
+
+def _queue_case(pipe, case_id: uuid.UUID | str, case_json: str, case_number: int | None) -> None:
+    pipe.set(_case_key(case_id), case_json, ex=CASE_TTL_SECONDS)
+    if case_number is not None:
+        # Secondary index: case numbers never change, so the key only points at the id.
+        pipe.set(_case_number_key(case_number), str(case_id), ex=CASE_TTL_SECONDS)
+
+
+async def get_cached_case_json(r: redis.Redis, case_id: uuid.UUID | str) -> str | None:
+    """Return the cached case body exactly as stored.
+
+    Only ``MedicalCase.model_dump_json()`` output is ever written under the case
+    key, so callers can serve it without re-validating.
+    """
+    return await r.get(_case_key(case_id))
+
+
+async def get_cached_case_id(r: redis.Redis, case_number: int) -> str | None:
+    return await r.get(_case_number_key(case_number))
+
+
+async def set_cached_case(
+    r: redis.Redis,
+    case_id: uuid.UUID | str,
+    case_json: str,
+    *,
+    case_number: int | None = None,
+) -> None:
+    async with r.pipeline(transaction=False) as pipe:
+        _queue_case(pipe, case_id, case_json, case_number)
+        await pipe.execute()
+
+
+async def cache_written_case(
+    r: redis.Redis,
+    case_id: uuid.UUID | str,
+    case_json: str,
+    *,
+    case_number: int | None = None,
+) -> None:
+    """Cache a freshly written case and retire cached list pages in one round-trip."""
+    async with r.pipeline(transaction=False) as pipe:
+        _queue_case(pipe, case_id, case_json, case_number)
+        pipe.incr(CASES_VERSION_KEY)
+        await pipe.execute()
+
+
+async def invalidate_case(r: redis.Redis, case_id: uuid.UUID | str) -> None:
+    async with r.pipeline(transaction=False) as pipe:
+        pipe.delete(_case_key(case_id))
+        pipe.incr(CASES_VERSION_KEY)
+        await pipe.execute()
+
+
+# ── Case list pages ──────────────────────────────────────────────────────────
+
+
+async def case_list_key(
+    r: redis.Redis,
+    *,
+    page: int,
+    page_size: int,
+    specialty: str | None,
+    search: str | None,
+) -> str:
+    version = await r.get(CASES_VERSION_KEY) or 0
+    # Hash the free-text filters rather than joining them, so a ":" in a
+    # specialty or search term can't make two queries share a key.
+    params = orjson.dumps([specialty, search, page, page_size])
+    return f"cases:list:{version}:{hashlib.blake2b(params, digest_size=16).hexdigest()}"
+
+
+async def get_cached_case_list(r: redis.Redis, key: str) -> str | None:
+    return await r.get(key)
+
+
+async def set_cached_case_list(r: redis.Redis, key: str, body: str) -> None:
+    await r.set(key, body, ex=CASE_LIST_TTL_SECONDS)
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 import uuid
 
 import openai
 
 from app.config import settings
-from app.schemas.medical_case import MedicalCase
+from app.schemas.medical_case import Difficulty, MedicalCase
 
 
 SYSTEM_PROMPT = (
@@ -18,6 +19,25 @@ SYSTEM_PROMPT = (
     "For case_id, always use a valid UUID v4 string (e.g. '550e8400-e29b-41d4-a716-446655440000')."
 )
 
+# Shared read-only across requests; the SDK only serializes it.
+_SYSTEM_MSG = {"role": "system", "content": SYSTEM_PROMPT}
+
+# Structured-output format derived from MedicalCase once at import;
+# responses.parse would regenerate the strict schema on every call. The SDK's
+# public pydantic_function_tool produces the same strict schema as parameters.
+_CASE_TEXT_FORMAT = {
+    "type": "json_schema",
+    "name": "MedicalCase",
+    "schema": openai.pydantic_function_tool(MedicalCase)["function"]["parameters"],
+    "strict": True,
+}
+
+
+@functools.cache
+def _client() -> openai.AsyncOpenAI:
+    # One client per process so generations reuse pooled keep-alive connections.
+    return openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+
 
 async def generate_case(
     *,
@@ -25,33 +45,29 @@ async def generate_case(
     prompt: str | None = None,
     difficulty: str | None = None,
 ) -> MedicalCase:
-    client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-
-    user_parts: list[str] = ["Generate a detailed medical case."]
+    user_content = "Generate a detailed medical case."
     if specialty:
-        user_parts.append(f"Specialty: {specialty}")
+        user_content += f" Specialty: {specialty}"
     if difficulty:
-        user_parts.append(f"Difficulty: {difficulty}")
+        user_content += f" Difficulty: {difficulty}"
     if prompt:
-        user_parts.append(f"Additional context: {prompt}")
+        user_content += f" Additional context: {prompt}"
 
-    response = await client.responses.parse(
+    response = await _client().responses.create(
         model=settings.OPENAI_MODEL,
-        input=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": " ".join(user_parts)},
-        ],
-        text_format=MedicalCase,
+        input=[_SYSTEM_MSG, {"role": "user", "content": user_content}],
+        text={"format": _CASE_TEXT_FORMAT},
     )
 
-    case = response.output_parsed
-    if case is None:
+    if not response.output_text:
         raise ValueError("LLM returned empty parsed response.")
+    case = MedicalCase.model_validate_json(response.output_text)
 
-    # Override LLM-generated case_id with a proper UUID
-    case.case_id = str(uuid.uuid4())
+    # Override the LLM-generated case_id with a proper UUID and pin the requested
+    # specialty/difficulty; one shallow copy, no re-validation of the parsed case.
+    overrides: dict = {"case_id": uuid.uuid4()}
     if specialty:
-        case.specialty = specialty
+        overrides["specialty"] = specialty
     if difficulty:
-        case.difficulty = difficulty  # type: ignore[assignment]
-    return case
+        overrides["difficulty"] = Difficulty(difficulty)
+    return case.model_copy(update=overrides)
@@ -2,15 +2,67 @@
 
 from __future__ import annotations
 
+import copy
 import os
+import threading
 
 import requests
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
 
 BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
+DEFAULT_TIMEOUT = 30
 
+# One pooled session for the process, so repeated calls reuse keep-alive
+# connections to the backend instead of opening a new one each time.
+_session = requests.Session()
+for _scheme in ("http://", "https://"):
+    _session.mount(_scheme, HTTPAdapter(pool_connections=10, pool_maxsize=20))
 
-def _url(path: str) -> str:
-    return f"{BASE_URL}{path}"
+
+# Streamlit re-runs the whole script on every interaction, so single-case reads
+# are cached briefly, along with the number -> id mapping used to find them.
+# Both are bounded and guarded by the same lock.
+_case_cache: TTLCache[str, dict] = TTLCache(maxsize=512, ttl=300)
+_case_ids_by_number: TTLCache[int, str] = TTLCache(maxsize=512, ttl=300)
+_cache_lock = threading.Lock()
+
+
+def _remember_case(case: dict) -> dict:
+    with _cache_lock:
+        _case_cache[str(case["case_id"])] = case
+        if case.get("case_number") is not None:
+            _case_ids_by_number[case["case_number"]] = str(case["case_id"])
+    # Callers get their own copy so edits in the UI can't leak into the cache.
+    return copy.deepcopy(case)
+
+
+def _cached_case(case_id: str) -> dict | None:
+    with _cache_lock:
+        case = _case_cache.get(case_id)
+    return copy.deepcopy(case) if case is not None else None
+
+
+def _cached_case_by_number(case_number: int) -> dict | None:
+    with _cache_lock:
+        case_id = _case_ids_by_number.get(case_number)
+        case = _case_cache.get(case_id) if case_id else None
+    return copy.deepcopy(case) if case is not None else None
+
+
+def _forget_case(case_id: str, *, deleted: bool = False) -> None:
+    with _cache_lock:
+        _case_cache.pop(case_id, None)
+        if deleted:
+            # A deleted case's number must not keep resolving to its dead id.
+            for number in [n for n, cid in _case_ids_by_number.items() if cid == case_id]:
+                del _case_ids_by_number[number]
+
+
+def _request(method: str, path: str, *, timeout: float = DEFAULT_TIMEOUT, **kwargs) -> requests.Response:
+    resp = _session.request(method, f"{BASE_URL}{path}", timeout=timeout, **kwargs)
+    resp.raise_for_status()
+    return resp
 
 
 def generate_case(specialty: str | None = None, prompt: str | None = None, difficulty: str | None = None) -> dict:
@@ -21,15 +73,11 @@ def generate_case(specialty: str | None = None, prompt: str | None = None, diffi
         body["prompt"] = prompt
     if difficulty:
         body["difficulty"] = difficulty
-    resp = requests.post(_url("/api/v1/cases/generate"), json=body, timeout=120)
-    resp.raise_for_status()
-    return resp.json()
+    return _request("POST", "/api/v1/cases/generate", json=body, timeout=120).json()
 
 
 def create_case(payload: dict) -> dict:
-    resp = requests.post(_url("/api/v1/cases/"), json=payload, timeout=30)
-    resp.raise_for_status()
-    return resp.json()
+    return _request("POST", "/api/v1/cases/", json=payload).json()
 
 
 def list_cases(
@@ -43,49 +91,46 @@ def list_cases(
         params["specialty"] = specialty
     if search:
         params["search"] = search
-    resp = requests.get(_url("/api/v1/cases/"), params=params, timeout=30)
-    resp.raise_for_status()
-    return resp.json()
+    return _request("GET", "/api/v1/cases/", params=params).json()
 
 
 def get_case(case_id: str) -> dict:
-    resp = requests.get(_url(f"/api/v1/cases/{case_id}"), timeout=30)
-    resp.raise_for_status()
-    return resp.json()
+    case = _cached_case(case_id)
+    if case is None:
+        case = _remember_case(_request("GET", f"/api/v1/cases/{case_id}").json())
+    return case
 
 
 def get_case_by_number(case_number: int) -> dict:
-    resp = requests.get(_url(f"/api/v1/cases/by-number/{case_number}"), timeout=30)
-    resp.raise_for_status()
-    return resp.json()
+    case = _cached_case_by_number(case_number)
+    if case is None:
+        case = _remember_case(_request("GET", f"/api/v1/cases/by-number/{case_number}").json())
+    return case
 
 
 def update_case(case_id: str, payload: dict) -> dict:
-    resp = requests.put(_url(f"/api/v1/cases/{case_id}"), json=payload, timeout=30)
-    resp.raise_for_status()
-    return resp.json()
+    _forget_case(case_id)
+    return _remember_case(_request("PUT", f"/api/v1/cases/{case_id}", json=payload).json())
 
 
 def patch_case(case_id: str, payload: dict) -> dict:
-    resp = requests.patch(_url(f"/api/v1/cases/{case_id}"), json=payload, timeout=30)
-    resp.raise_for_status()
-    return resp.json()
+    _forget_case(case_id)
+    return _remember_case(_request("PATCH", f"/api/v1/cases/{case_id}", json=payload).json())
 
 
 def delete_case(case_id: str) -> None:
-    resp = requests.delete(_url(f"/api/v1/cases/{case_id}"), timeout=30)
-    resp.raise_for_status()
+    _forget_case(case_id, deleted=True)
+    _request("DELETE", f"/api/v1/cases/{case_id}")
 
 
-def save_transcript(conversation_id: str, case_number: int, transcript: list[dict]) -> dict:
-    resp = requests.post(
-        _url("/api/v1/transcripts/"),
+def save_transcript(conversation_id: str, case_number: int, transcript: list[dict], append: bool = False) -> dict:
+    return _request(
+        "POST",
+        "/api/v1/transcripts/",
         json={
             "conversation_id": conversation_id,
             "case_number": case_number,
             "transcript": transcript,
+            "append": append,
         },
-        timeout=30,
-    )
-    resp.raise_for_status()
-    return resp.json()
+    ).json()
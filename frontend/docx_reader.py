@@ -0,0 +1,82 @@
+"""Streaming paragraph reader for .docx uploads.
+
+Reads ``word/document.xml`` with the stdlib iterparse instead of building a
+python-docx object model, but yields the same text python-docx's
+``Document.paragraphs`` / ``Paragraph.text`` would.
+"""
+
+from __future__ import annotations
+
+import io
+import zipfile
+from collections.abc import Iterator
+from xml.etree import ElementTree
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY = f"{_W}body"
+_W_P = f"{_W}p"
+_W_R = f"{_W}r"
+_W_HYPERLINK = f"{_W}hyperlink"
+_W_PSTYLE = f"{_W}pPr/{_W}pStyle"
+_W_VAL = f"{_W}val"
+_W_TYPE = f"{_W}type"
+
+# Run children that carry text, as python-docx renders them. A <w:br> only
+# counts as a line break when it is a text-wrapping break (the default type);
+# page and column breaks render as nothing.
+_RUN_TEXT = {
+    f"{_W}t": None,
+    f"{_W}tab": "\t",
+    f"{_W}ptab": "\t",
+    f"{_W}cr": "\n",
+    f"{_W}br": "\n",
+    f"{_W}noBreakHyphen": "-",
+}
+
+
+def _run_text(run: ElementTree.Element) -> Iterator[str]:
+    for child in run:
+        if child.tag not in _RUN_TEXT:
+            continue
+        if child.tag == f"{_W}br" and child.get(_W_TYPE, "textWrapping") != "textWrapping":
+            continue
+        rendered = _RUN_TEXT[child.tag]
+        yield (child.text or "") if rendered is None else rendered
+
+
+def _paragraph_text(p: ElementTree.Element) -> str:
+    """Text of the paragraph's own runs (including hyperlinked runs).
+
+    Only direct runs are read, so text boxes and their ``mc:Fallback`` copies
+    anchored inside a run are not folded into the paragraph.
+    """
+    parts: list[str] = []
+    for child in p:
+        if child.tag == _W_R:
+            parts.extend(_run_text(child))
+        elif child.tag == _W_HYPERLINK:
+            for run in child.iterfind(_W_R):
+                parts.extend(_run_text(run))
+    return "".join(parts)
+
+
+def iter_paragraphs(file_bytes: bytes) -> Iterator[tuple[str, str]]:
+    """Yield ``(style_id, stripped_text)`` for each body-level paragraph.
+
+    Paragraphs nested in tables or text boxes are skipped, matching
+    ``Document.paragraphs``. Each top-level body element is cleared once
+    read, so memory stays flat for long documents.
+    """
+    with zipfile.ZipFile(io.BytesIO(file_bytes)) as zf, zf.open("word/document.xml") as xml:
+        parents: list[str] = []
+        for event, elem in ElementTree.iterparse(xml, events=("start", "end")):
+            if event == "start":
+                parents.append(elem.tag)
+                continue
+            parents.pop()
+            if not parents or parents[-1] != _W_BODY:
+                continue
+            if elem.tag == _W_P:
+                style = elem.find(_W_PSTYLE)
+                yield (style.get(_W_VAL, "") if style is not None else ""), _paragraph_text(elem).strip()
+            elem.clear()
@@ -2,25 +2,48 @@
 
 from __future__ import annotations
 
-import io
-import json
+import hashlib
+import logging
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+import orjson
+import pandas as pd
+import plotly.express as px
 import plotly.graph_objects as go
 import requests
 import streamlit as st
-from docx import Document
+from requests.adapters import HTTPAdapter
+
+from docx_reader import iter_paragraphs
 
 st.set_page_config(page_title="Evaluation Dashboard", layout="wide")
 
 API_BASE = os.getenv("API_BASE_URL", "http://localhost:8000")
 SAMPLE_DIR = Path(__file__).resolve().parent.parent / "sample_data"
+BATCH_WORKERS = 8
+EVAL_CACHE_DIR = Path(os.getenv("EVAL_CACHE_DIR", Path.home() / ".cache" / "eval_dashboard"))
+EVAL_CACHE_MAX_AGE = float(os.getenv("EVAL_CACHE_MAX_AGE_DAYS", "7")) * 86400
+# Temp files older than this belong to writes that never finished.
+_EVAL_CACHE_TMP_MAX_AGE = 3600
+
+logger = logging.getLogger(__name__)
 
 
 # ── File parsing helpers ────────────────────────────────────────────────────
 
+_SPEAKER_RE = re.compile(r"^(Student|Patient)\s*:\s*(.+)", re.IGNORECASE)
+# Same prefix rule, applied line by line across a whole plain-text transcript.
+_SPEAKER_LINE_RE = re.compile(
+    r"^[ \t]*(Student|Patient)[ \t]*:[ \t]*(\S.*)$", re.IGNORECASE | re.MULTILINE,
+)
+_DEMO_RE = re.compile(
+    r"(?P<age>\d{1,3})\s*(?:year|yo|y/?o)|\b(?P<sex>male|female|man|woman)\b", re.IGNORECASE,
+)
 
 def _parse_case_from_docx(file_bytes: bytes) -> dict:
     """Extract a case description dict from a Word document.
@@ -29,50 +52,52 @@ def _parse_case_from_docx(file_bytes: bytes) -> dict:
     "Chief Complaint", "HPI", "Past Medical History", etc. Falls back to
     treating the entire document body as the HPI if no headings are found.
     """
-    doc = Document(io.BytesIO(file_bytes))
-
     # Map heading text (lowered) → list of paragraph texts under that heading
     sections: dict[str, list[str]] = {}
     current_heading = "_preamble"
     sections[current_heading] = []
+    body: list[str] = []
 
-    for para in doc.paragraphs:
-        if para.style and para.style.name and para.style.name.startswith("Heading"):
-            current_heading = para.text.strip().lower()
+    for style, text in iter_paragraphs(file_bytes):
+        if style.startswith("Heading"):
+            current_heading = text.lower()
             sections[current_heading] = []
-        elif para.text.strip():
-            sections[current_heading].append(para.text.strip())
-
-    def _get(keys: list[str]) -> str:
-        for k in keys:
-            if k in sections and sections[k]:
-                return "\n".join(sections[k])
-        return ""
-
-    def _get_list(keys: list[str]) -> list[str]:
-        text = _get(keys)
-        if not text:
-            return []
-        return [line.lstrip("•-– ").strip() for line in text.split("\n") if line.strip()]
+        elif text:
+            sections[current_heading].append(text)
+        if text:
+            body.append(text)
 
     # If the document has no headings, treat the full text as a single narrative
-    full_text = "\n".join(p.text for p in doc.paragraphs if p.text.strip())
     if len(sections) <= 1:
         return {
             "chief_complaint": "",
-            "hpi": full_text,
+            "hpi": "\n".join(body),
             "emotional_presentation": "",
         }
 
+    # Join each non-empty section once; the lookups below only pick among them.
+    section_text = {k: "\n".join(v) for k, v in sections.items() if v}
+
+    def _get(keys: list[str]) -> str:
+        return next((section_text[k] for k in keys if k in section_text), "")
+
+    def _get_list(keys: list[str]) -> list[str]:
+        text = _get(keys)
+        if not text:
+            return []
+        return [line.lstrip("•-– ").strip() for line in text.splitlines() if line.strip()]
+
     # Demographics — try to pull age/sex from preamble or demographics heading
     demo: dict = {}
     demo_text = _get(["demographics", "patient demographics", "_preamble"])
-    age_match = re.search(r"(\d{1,3})\s*(?:year|yo|y/?o)", demo_text, re.IGNORECASE)
-    sex_match = re.search(r"\b(male|female|man|woman)\b", demo_text, re.IGNORECASE)
-    if age_match:
-        demo["age"] = int(age_match.group(1))
-    if sex_match:
-        demo["sex"] = sex_match.group(1).lower()
+    # One scan for both; the first occurrence of each wins.
+    for m in _DEMO_RE.finditer(demo_text):
+        if m["age"] and "age" not in demo:
+            demo["age"] = int(m["age"])
+        elif m["sex"] and "sex" not in demo:
+            demo["sex"] = m["sex"].lower()
+        if len(demo) == 2:
+            break
 
     return {
         "demographics": demo,
@@ -98,15 +123,13 @@ def _parse_transcript_from_docx(file_bytes: bytes) -> dict:
 
     Expects lines formatted as "Student: ..." or "Patient: ...".
     """
-    doc = Document(io.BytesIO(file_bytes))
     turns: list[dict] = []
     turn_num = 0
 
-    for para in doc.paragraphs:
-        text = para.text.strip()
+    for _, text in iter_paragraphs(file_bytes):
         if not text:
             continue
-        match = re.match(r"^(Student|Patient)\s*:\s*(.+)", text, re.IGNORECASE)
+        match = _SPEAKER_RE.match(text)
         if match:
             turn_num += 1
             turns.append({
@@ -120,33 +143,26 @@ def _parse_transcript_from_docx(file_bytes: bytes) -> dict:
 
 def _parse_transcript_from_text(text: str) -> dict:
     """Parse a plain-text transcript with 'Student:' / 'Patient:' prefixes."""
-    turns: list[dict] = []
-    turn_num = 0
-
-    for line in text.strip().split("\n"):
-        line = line.strip()
-        if not line:
-            continue
-        match = re.match(r"^(Student|Patient)\s*:\s*(.+)", line, re.IGNORECASE)
-        if match:
-            turn_num += 1
-            turns.append({
-                "turn_number": turn_num,
-                "speaker": match.group(1).capitalize(),
-                "content": match.group(2).strip(),
-            })
-
-    return {"turns": turns}
+    return {
+        "turns": [
+            {
+                "turn_number": i,
+                "speaker": m.group(1).capitalize(),
+                "content": m.group(2).strip(),
+            }
+            for i, m in enumerate(_SPEAKER_LINE_RE.finditer(text), start=1)
+        ]
+    }
 
 
-def _read_uploaded_file(uploaded_file, file_type: str) -> str | None:
-    """Read an uploaded file (JSON or DOCX) and return JSON string, or None."""
-    if uploaded_file is None:
-        return None
+def _to_json(obj) -> str:
+    """Pretty JSON text for the input text areas."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
 
-    raw = uploaded_file.read()
-    name = uploaded_file.name.lower()
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def _parse_upload(raw: bytes, name: str, file_type: str) -> str | None:
+    """Parse uploaded bytes to a JSON string; memoized on the content hash."""
     if name.endswith(".json"):
         return raw.decode("utf-8")
 
@@ -155,29 +171,124 @@ def _read_uploaded_file(uploaded_file, file_type: str) -> str | None:
             parsed = _parse_case_from_docx(raw)
         else:
             parsed = _parse_transcript_from_docx(raw)
-        return json.dumps(parsed, indent=2)
+        return _to_json(parsed)
 
     return None
 
 
+def _read_uploaded_file(uploaded_file, file_type: str) -> str | None:
+    """Read an uploaded file (JSON or DOCX) and return JSON string, or None."""
+    if uploaded_file is None:
+        return None
+    return _parse_upload(uploaded_file.getvalue(), uploaded_file.name.lower(), file_type)
+
+
+def _parse_input(state_key: str, text: str):
+    """Parse JSON from a text area, or return None if it is invalid.
+
+    The last (text, result) pair is kept under ``state_key`` so reruns that
+    leave the text unchanged (any other widget event) skip the parse.
+    """
+    last = st.session_state.get(state_key)
+    if last is not None and last[0] == text:
+        return last[1]
+    try:
+        value = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        value = None
+    st.session_state[state_key] = (text, value)
+    return value
+
+
 # ── API helpers ──────────────────────────────────────────────────────────────
 
 
+@st.cache_resource
+def _session() -> requests.Session:
+    """Keep-alive session shared across reruns and batch worker threads."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=BATCH_WORKERS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 def _api_evaluate(payload: dict) -> dict:
-    resp = requests.post(f"{API_BASE}/api/v1/evaluate/", json=payload, timeout=120)
+    resp = _session().post(f"{API_BASE}/api/v1/evaluate/", json=payload, timeout=120)
     resp.raise_for_status()
     return resp.json()
 
 
+@st.cache_data(ttl=300, show_spinner=False)
+def _rubrics_version() -> str:
+    """The API's rubric-list ETag, which changes whenever a rubric version does."""
+    resp = _session().get(f"{API_BASE}/api/v1/evaluate/rubrics/list", timeout=10)
+    resp.raise_for_status()
+    return resp.headers.get("ETag", "")
+
+
+@st.cache_resource(show_spinner=False)
+def _prune_eval_cache() -> None:
+    """Once per process, drop expired results and temp files left by crashed writes."""
+    now = time.time()
+    for path in EVAL_CACHE_DIR.glob("*"):
+        max_age = _EVAL_CACHE_TMP_MAX_AGE if path.suffix == ".tmp" else EVAL_CACHE_MAX_AGE
+        try:
+            if now - path.stat().st_mtime > max_age:
+                path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            logger.warning("Could not prune eval cache file %s", path, exc_info=True)
+
+
+def _cached_evaluate(payload: dict) -> dict:
+    """``_api_evaluate`` memoized on disk by a hash of the full payload.
+
+    The payload carries the case, transcript, layer and model, and the key adds
+    the API's rubric version, so identical inputs are answered from
+    ``EVAL_CACHE_DIR`` without another LLM call until a rubric changes or the
+    entry is older than ``EVAL_CACHE_MAX_AGE_DAYS``.
+    """
+    _prune_eval_cache()
+    key = hashlib.blake2b(
+        orjson.dumps([_rubrics_version(), payload], option=orjson.OPT_SORT_KEYS), digest_size=16,
+    ).hexdigest()
+    path = EVAL_CACHE_DIR / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime <= EVAL_CACHE_MAX_AGE:
+            return orjson.loads(path.read_bytes())
+    except FileNotFoundError:
+        pass
+    except (OSError, orjson.JSONDecodeError):
+        logger.warning("Ignoring unreadable eval cache entry %s", path, exc_info=True)
+
+    result = _api_evaluate(payload)
+    # Write-then-rename so concurrent batch workers never see a partial file.
+    # A failed write only costs the cache entry; the result is still returned.
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        EVAL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(orjson.dumps(result))
+        tmp.replace(path)
+    except OSError:
+        logger.warning("Could not write eval cache entry %s", path, exc_info=True)
+        tmp.unlink(missing_ok=True)
+    return result
+
+
 # ── Chart helpers ────────────────────────────────────────────────────────────
 
 
-def _radar_chart(dimensions: list[dict], title: str) -> go.Figure:
-    """Create a radar/spider chart from dimension scores."""
-    names = [d["dimension"] for d in dimensions]
-    scores = [d["score"] for d in dimensions]
-    names_closed = names + [names[0]]
-    scores_closed = scores + [scores[0]]
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _radar_chart(names: tuple[str, ...], scores: tuple[int, ...], title: str) -> go.Figure:
+    """Create a radar/spider chart from dimension scores.
+
+    Cached as a resource: reruns get the same figure back without rebuilding
+    or unpickling it. Callers must not mutate the returned figure.
+    """
+    names_closed = names + names[:1]
+    scores_closed = scores + scores[:1]
 
     fig = go.Figure()
     fig.add_trace(
@@ -208,20 +319,78 @@ def _render_score_badge(score: int) -> str:
     return f":{color}[**{score}/5**]"
 
 
+def _batch_scores(batch: list[dict]) -> pd.DataFrame:
+    """One row per (transcript, layer, dimension) score across a batch."""
+    return pd.DataFrame.from_records(
+        [
+            (f"T{i}", er["layer"].replace("_", " ").title(), dim["dimension"], dim["score"])
+            for i, resp in enumerate(batch, start=1)
+            for er in resp.get("results", [])
+            for dim in er["dimensions"]
+        ],
+        columns=["Transcript", "Layer", "Dimension", "Score"],
+    )
+
+
+def _batch_charts(scores: pd.DataFrame) -> dict[str, go.Figure]:
+    """Build the batch and analytics figures for a non-empty score frame."""
+    box = px.box(
+        scores,
+        x="Dimension",
+        y="Score",
+        color="Layer",
+        title="Score Distribution Across Batch",
+    )
+    box.update_layout(yaxis=dict(range=[0, 5.5]))
+
+    # Rubric dimension names are unique across layers, so each (dimension,
+    # transcript) cell has one score; only fall back to averaging if a judge
+    # returned a duplicate dimension.
+    try:
+        pivot = scores.pivot(index="Dimension", columns="Transcript", values="Score")
+    except ValueError:
+        pivot = scores.pivot_table(
+            index="Dimension", columns="Transcript", values="Score", aggfunc="mean"
+        )
+    heatmap = px.imshow(
+        pivot,
+        text_auto=True,
+        color_continuous_scale="RdYlGn",
+        zmin=1,
+        zmax=5,
+        title="Dimension x Transcript Heatmap",
+    )
+
+    histogram = px.histogram(
+        scores,
+        x="Score",
+        color="Dimension",
+        barmode="overlay",
+        title="Score Distribution by Dimension",
+        nbins=5,
+    )
+    return {"box": box, "heatmap": heatmap, "histogram": histogram}
+
+
 # ── Load sample data ────────────────────────────────────────────────────────
 
+# Sample files are static. Streamlit re-executes this script on every rerun,
+# so st.cache_data (not functools.lru_cache) is what keeps them loaded.
+
 
+@st.cache_data(show_spinner=False)
 def _load_sample_case() -> dict | None:
     path = SAMPLE_DIR / "sample_case_chest_pain.json"
     if path.exists():
-        return json.loads(path.read_text())
+        return orjson.loads(path.read_bytes())
     return None
 
 
+@st.cache_data(show_spinner=False)
 def _load_sample_transcript(quality: str) -> dict | None:
     path = SAMPLE_DIR / f"sample_transcript_{quality}.json"
     if path.exists():
-        return json.loads(path.read_text())
+        return orjson.loads(path.read_bytes())
     return None
 
 
@@ -241,12 +410,14 @@ eval_layers = st.sidebar.multiselect(
     default=["Case Fidelity", "Student Performance"],
 )
 
-layer_map = {
-    frozenset(["Case Fidelity", "Student Performance"]): "both",
-    frozenset(["Case Fidelity"]): "case_fidelity",
-    frozenset(["Student Performance"]): "student_performance",
-}
-selected_layer = layer_map.get(frozenset(eval_layers), "both")
+has_fidelity = "Case Fidelity" in eval_layers
+has_performance = "Student Performance" in eval_layers
+if has_fidelity and not has_performance:
+    selected_layer = "case_fidelity"
+elif has_performance and not has_fidelity:
+    selected_layer = "student_performance"
+else:
+    selected_layer = "both"
 
 st.sidebar.divider()
 st.sidebar.caption("Sample data available for demo")
@@ -254,14 +425,14 @@ if st.sidebar.button("Load Sample Case"):
     sample = _load_sample_case()
     if sample:
         # Write directly to the widget key so it takes effect on rerun
-        st.session_state["case_input"] = json.dumps(sample, indent=2)
+        st.session_state["case_input"] = _to_json(sample)
         st.rerun()
 
 sample_quality = st.sidebar.radio("Sample transcript quality", ["good", "poor"], horizontal=True)
 if st.sidebar.button("Load Sample Transcript"):
     sample = _load_sample_transcript(sample_quality)
     if sample:
-        st.session_state["transcript_input"] = json.dumps(sample, indent=2)
+        st.session_state["transcript_input"] = _to_json(sample)
         st.rerun()
 
 # ── Main Area ────────────────────────────────────────────────────────────────
@@ -320,13 +491,14 @@ with tab_run:
             help='JSON with "turns" array, or plain text with "Student:" / "Patient:" prefixes',
         )
 
-    # Preview
-    with st.expander("Preview inputs", expanded=bool(case_input or transcript_input)):
+    # Preview — parsing is deferred until the user asks for it, so typing in
+    # large inputs doesn't pay for a parse on every rerun.
+    if st.toggle("Preview inputs", key="preview_expanded"):
         prev_col1, prev_col2 = st.columns(2)
         with prev_col1:
             if case_input:
-                try:
-                    parsed_case = json.loads(case_input)
+                parsed_case = _parse_input("_case_parsed", case_input)
+                if parsed_case is not None:
                     st.markdown(f"**Chief Complaint:** {parsed_case.get('chief_complaint', 'N/A')}")
                     st.markdown(f"**Final Diagnosis:** {parsed_case.get('final_diagnosis', 'N/A')}")
                     demo = parsed_case.get("demographics", {})
@@ -334,12 +506,12 @@ with tab_run:
                         st.markdown(
                             f"**Patient:** {demo.get('age', '?')}yo {demo.get('sex', '?')}"
                         )
-                except json.JSONDecodeError:
+                else:
                     st.warning("Invalid JSON in case input")
         with prev_col2:
             if transcript_input:
-                try:
-                    parsed_transcript = json.loads(transcript_input)
+                parsed_transcript = _parse_input("_transcript_parsed", transcript_input)
+                if parsed_transcript is not None:
                     turns = parsed_transcript.get("turns", [])
                     st.markdown(f"**Turns:** {len(turns)}")
                     if turns:
@@ -348,7 +520,7 @@ with tab_run:
                             f"**First turn:** {first.get('speaker', '?')}: "
                             f"{first.get('content', '')[:100]}..."
                         )
-                except json.JSONDecodeError:
+                else:
                     # Might be plain text — try to parse
                     parsed_transcript = _parse_transcript_from_text(transcript_input)
                     if parsed_transcript["turns"]:
@@ -361,16 +533,14 @@ with tab_run:
         if not case_input or not transcript_input:
             st.error("Please provide both a case description and a transcript.")
         else:
-            try:
-                case_data = json.loads(case_input)
-            except json.JSONDecodeError:
+            case_data = _parse_input("_case_parsed", case_input)
+            if case_data is None:
                 st.error("Invalid JSON in case input. Upload a JSON or DOCX file.")
                 st.stop()
 
             # Transcript: try JSON first, then plain text
-            try:
-                transcript_data = json.loads(transcript_input)
-            except json.JSONDecodeError:
+            transcript_data = _parse_input("_transcript_parsed", transcript_input)
+            if transcript_data is None:
                 transcript_data = _parse_transcript_from_text(transcript_input)
                 if not transcript_data["turns"]:
                     st.error(
@@ -388,7 +558,7 @@ with tab_run:
 
             try:
                 with st.spinner("Evaluating transcript... this may take 15-30 seconds per layer."):
-                    result = _api_evaluate(payload)
+                    result = _cached_evaluate(payload)
 
                 st.session_state["eval_result"] = result
                 st.success("Evaluation complete!")
@@ -421,7 +591,11 @@ with tab_run:
             )
 
             st.plotly_chart(
-                _radar_chart(eval_result["dimensions"], layer_name),
+                _radar_chart(
+                    tuple(d["dimension"] for d in eval_result["dimensions"]),
+                    tuple(d["score"] for d in eval_result["dimensions"]),
+                    layer_name,
+                ),
                 use_container_width=True,
             )
 
@@ -430,25 +604,22 @@ with tab_run:
                     f"{dim['dimension']} — {_render_score_badge(dim['score'])} (weight: {dim['weight']})",
                     expanded=False,
                 ):
-                    st.markdown(f"**Rationale:** {dim['rationale']}")
-
+                    # One markdown element per dimension instead of one per line.
+                    md = [f"**Rationale:** {dim['rationale']}"]
                     if dim.get("strengths"):
-                        st.markdown("**Strengths:**")
-                        for s in dim["strengths"]:
-                            st.markdown(f"- {s}")
-
+                        md.append("**Strengths:**\n" + "\n".join(f"- {s}" for s in dim["strengths"]))
                     if dim.get("growth_areas"):
-                        st.markdown("**Growth Areas:**")
-                        for g in dim["growth_areas"]:
-                            st.markdown(f"- {g}")
-
+                        md.append("**Growth Areas:**\n" + "\n".join(f"- {g}" for g in dim["growth_areas"]))
                     if dim.get("evidence"):
-                        st.markdown("**Evidence Citations:**")
-                        for ev in dim["evidence"]:
-                            st.info(
-                                f"**Turn {ev['turn_number']}** ({ev['speaker']}): "
-                                f'"{ev["quote"]}"\n\n*{ev["relevance"]}*'
-                            )
+                        md.append("**Evidence Citations:**")
+                    st.markdown("\n\n".join(md))
+
+                    # Evidence keeps its st.info callouts, one per citation.
+                    for ev in dim.get("evidence") or ():
+                        st.info(
+                            f"**Turn {ev['turn_number']}** ({ev['speaker']}): "
+                            f'"{ev["quote"]}"\n\n*{ev["relevance"]}*'
+                        )
 
             st.markdown("---")
             st.markdown(f"**Overall Summary:** {eval_result['overall_summary']}")
@@ -457,7 +628,7 @@ with tab_run:
         st.divider()
         st.download_button(
             "Download Evaluation JSON",
-            data=json.dumps(result, indent=2, default=str),
+            data=orjson.dumps(result, option=orjson.OPT_INDENT_2),
             file_name="evaluation_result.json",
             mime="application/json",
         )
@@ -497,38 +668,50 @@ with tab_batch:
             st.error("Please provide a case and at least one transcript file.")
         else:
             try:
-                case_data = json.loads(batch_case_input)
-            except json.JSONDecodeError:
+                case_data = orjson.loads(batch_case_input)
+            except orjson.JSONDecodeError:
                 st.error("Invalid case JSON.")
                 st.stop()
 
-            progress = st.progress(0, text="Evaluating transcripts...")
-            results = []
-            for i, f in enumerate(batch_files):
+            payloads: list[tuple[str, dict]] = []
+            for f in batch_files:
                 parsed_t = _read_uploaded_file(f, "transcript")
                 if not parsed_t:
                     st.warning(f"Could not parse {f.name}, skipping.")
                     continue
-                transcript_data = json.loads(parsed_t)
-
-                payload = {
+                payloads.append((f.name, {
                     "case_description": case_data,
-                    "transcript": transcript_data,
+                    "transcript": orjson.loads(parsed_t),
                     "layer": selected_layer,
                     "model": model_choice,
-                }
-                try:
-                    resp = _api_evaluate(payload)
-                    results.append(resp)
-                except Exception as e:
-                    st.warning(f"Evaluation failed for {f.name}: {e}")
+                }))
 
-                progress.progress(
-                    (i + 1) / len(batch_files),
-                    text=f"Evaluated {i + 1}/{len(batch_files)} transcripts",
-                )
+            # Each evaluation is seconds of LLM latency, so run them concurrently
+            # and keep the results in upload order.
+            progress = st.progress(0, text="Evaluating transcripts...")
+            ordered: list[dict | None] = [None] * len(payloads)
+            with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as pool:
+                futures = {
+                    pool.submit(_cached_evaluate, payload): i
+                    for i, (_, payload) in enumerate(payloads)
+                }
+                for done, future in enumerate(as_completed(futures), start=1):
+                    i = futures[future]
+                    try:
+                        ordered[i] = future.result()
+                    except Exception as e:
+                        st.warning(f"Evaluation failed for {payloads[i][0]}: {e}")
+                    progress.progress(
+                        done / len(payloads),
+                        text=f"Evaluated {done}/{len(payloads)} transcripts",
+                    )
+            results = [r for r in ordered if r is not None]
 
             st.session_state["batch_results"] = results
+            # Built once per batch; both tabs render from these on every rerun.
+            scores = _batch_scores(results)
+            st.session_state["batch_scores"] = scores
+            st.session_state["batch_charts"] = _batch_charts(scores) if not scores.empty else None
             st.success(f"Batch evaluation complete — {len(results)} transcripts evaluated.")
 
     if "batch_results" in st.session_state:
@@ -544,28 +727,9 @@ with tab_batch:
 
         st.dataframe(rows, use_container_width=True)
 
-        import plotly.express as px
-
-        all_scores = []
-        for resp in batch:
-            for er in resp.get("results", []):
-                for dim in er["dimensions"]:
-                    all_scores.append({
-                        "Layer": er["layer"].replace("_", " ").title(),
-                        "Dimension": dim["dimension"],
-                        "Score": dim["score"],
-                    })
-
-        if all_scores:
-            fig = px.box(
-                all_scores,
-                x="Dimension",
-                y="Score",
-                color="Layer",
-                title="Score Distribution Across Batch",
-            )
-            fig.update_layout(yaxis=dict(range=[0, 5.5]))
-            st.plotly_chart(fig, use_container_width=True)
+        charts = st.session_state["batch_charts"]
+        if charts:
+            st.plotly_chart(charts["box"], use_container_width=True)
 
 # ── Tab 3: Analytics ─────────────────────────────────────────────────────────
 
@@ -577,47 +741,13 @@ with tab_analytics:
     )
 
     if "batch_results" in st.session_state and st.session_state["batch_results"]:
-        batch = st.session_state["batch_results"]
-        import pandas as pd
-        import plotly.express as px
-
-        heatmap_data = []
-        for i, resp in enumerate(batch):
-            for er in resp.get("results", []):
-                for dim in er["dimensions"]:
-                    heatmap_data.append({
-                        "Transcript": f"T{i + 1}",
-                        "Dimension": dim["dimension"],
-                        "Score": dim["score"],
-                    })
-
-        if heatmap_data:
-            df = pd.DataFrame(heatmap_data)
-            pivot = df.pivot_table(
-                index="Dimension", columns="Transcript", values="Score", aggfunc="mean"
-            )
-
-            fig = px.imshow(
-                pivot,
-                text_auto=True,
-                color_continuous_scale="RdYlGn",
-                zmin=1,
-                zmax=5,
-                title="Dimension x Transcript Heatmap",
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-            fig2 = px.histogram(
-                df,
-                x="Score",
-                color="Dimension",
-                barmode="overlay",
-                title="Score Distribution by Dimension",
-                nbins=5,
-            )
-            st.plotly_chart(fig2, use_container_width=True)
+        df = st.session_state["batch_scores"]
+        charts = st.session_state["batch_charts"]
+        if charts:
+            st.plotly_chart(charts["heatmap"], use_container_width=True)
+            st.plotly_chart(charts["histogram"], use_container_width=True)
 
-            csv = df.to_csv(index=False)
+            csv = df[["Transcript", "Dimension", "Score"]].to_csv(index=False)
             st.download_button(
                 "Export Analytics CSV",
                 data=csv,
@@ -4,13 +4,19 @@ from __future__ import annotations
 
 import base64
 import io
+import logging
 import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 import random
+import re
 import uuid
+import wave
+import zipfile
+from xml.sax.saxutils import escape
 
-from docx import Document
 from dotenv import load_dotenv
 import openai
 import streamlit as st
@@ -22,8 +28,11 @@ load_dotenv(Path(__file__).resolve().parent.parent / ".env")
 st.set_page_config(page_title="Patient Interview", layout="wide")
 
 OPENAI_AUDIO_MODEL = os.getenv("OPENAI_AUDIO_MODEL", "gpt-4o-audio-preview")
+PCM16_SAMPLE_RATE = 24_000  # audio model's pcm16 output: 24 kHz, mono, little-endian
 VOICES = ["alloy", "ash", "ballad", "coral", "echo", "fable", "onyx", "nova", "sage", "shimmer"]
 
+logger = logging.getLogger(__name__)
+
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
@@ -87,65 +96,227 @@ RULES:
 - Do NOT volunteer all information at once; let the student ask."""
 
 
-def _transcribe_audio(audio_bytes: bytes) -> str:
-    """Transcribe user audio via OpenAI Whisper. Returns text or fallback string."""
-    client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY", ""))
+@st.cache_resource
+def _openai_client(api_key: str) -> openai.OpenAI:
+    """One client per API key, so its connection pool survives reruns."""
+    return openai.OpenAI(api_key=api_key, max_retries=2, timeout=60.0)
+
+
+@st.cache_resource
+def _transcribe_pool() -> ThreadPoolExecutor:
+    """Shared workers for Whisper calls that overlap the patient reply."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="transcribe")
+
+
+@st.cache_resource
+def _save_pool() -> ThreadPoolExecutor:
+    """Background writer for transcript saves; one worker keeps them in order."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="transcript-save")
+
+
+def _save_new_turns(
+    conversation_id: str, case_number: int, entries: list[dict], progress: dict
+) -> None:
+    """Append the turns not yet stored, then advance ``progress["saved"]``.
+
+    Runs on the save worker. The counter only moves after a successful save,
+    so turns from a failed save are re-sent with the next one.
+    """
+    new_turns = entries[progress["saved"]:]
+    if new_turns:
+        save_transcript(conversation_id, case_number, new_turns, append=True)
+        progress["saved"] = len(entries)
+
+
+def _log_save_failure(future) -> None:
+    if (exc := future.exception()) is not None:
+        logger.warning("Transcript save failed: %s", exc)
+
+
+def _transcribe_audio(client: openai.OpenAI, audio_bytes: bytes) -> str:
+    """Transcribe user audio via OpenAI Whisper. Returns text or fallback string.
+
+    Takes the client explicitly because it runs on a worker thread, outside
+    Streamlit's script context.
+    """
     audio_file = io.BytesIO(audio_bytes)
     audio_file.name = "question.wav"
     result = client.audio.transcriptions.create(model="whisper-1", file=audio_file)
     return result.text.strip() or "(inaudible)"
 
 
-def _get_ai_response(messages: list, voice: str) -> tuple[str, bytes, str]:
-    """Call OpenAI Chat Completions with audio modalities. Returns (transcript, wav_bytes, audio_id)."""
-    client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY", ""))
-    completion = client.chat.completions.create(
+def _pcm16_to_wav(pcm: bytes) -> bytes:
+    """Wrap raw 16-bit mono PCM from the audio model in a WAV container."""
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(PCM16_SAMPLE_RATE)
+        wav.writeframes(pcm)
+    return buf.getvalue()
+
+
+def _get_ai_response(
+    system_prompt: str,
+    turns: list,
+    voice: str,
+    cache_key: str,
+    on_transcript: Callable[[str], None] | None = None,
+) -> tuple[str, bytes, str]:
+    """Call OpenAI Chat Completions with audio modalities. Returns (transcript, wav_bytes, audio_id).
+
+    The system prompt is fixed for the whole interview and always sent first,
+    so every turn shares a byte-identical prefix that OpenAI's automatic prompt
+    cache can reuse; ``cache_key`` routes an interview's turns to that cache.
+
+    The reply is streamed: ``on_transcript`` receives the growing transcript as
+    it arrives, and the PCM chunks are assembled into a WAV at the end.
+    """
+    client = _openai_client(os.getenv("OPENAI_API_KEY", ""))
+    stream = client.chat.completions.create(
         model=OPENAI_AUDIO_MODEL,
         modalities=["text", "audio"],
-        audio={"voice": voice, "format": "wav"},
-        messages=messages,
-    )
-    choice = completion.choices[0].message
-    transcript = choice.audio.transcript
-    wav_bytes = base64.b64decode(choice.audio.data)
-    audio_id = choice.audio.id
-    return transcript, wav_bytes, audio_id
-
-
-def _build_transcript_docx(case: dict, history: list[dict]) -> bytes:
-    """Build a Word document from the interview history and return raw bytes."""
-    doc = Document()
-    doc.add_heading(case.get("case_title", "Untitled Case"), level=1)
-    doc.add_paragraph(
-        f"Case #{case.get('case_number', '—')} | "
-        f"Generated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}"
+        # Streaming audio is only available as raw PCM.
+        audio={"voice": voice, "format": "pcm16"},
+        messages=[{"role": "system", "content": system_prompt}, *turns],
+        prompt_cache_key=cache_key,
+        stream=True,
     )
-    doc.add_paragraph("")
 
+    pcm = bytearray()
+    transcript = ""
+    audio_id = ""
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        audio = getattr(chunk.choices[0].delta, "audio", None)
+        if not audio:
+            continue
+        if not isinstance(audio, dict):
+            # Typed in newer SDKs; older ones pass the raw dict through.
+            audio = audio.model_dump(exclude_none=True)
+        audio_id = audio.get("id") or audio_id
+        if audio.get("data"):
+            pcm += base64.b64decode(audio["data"])
+        if audio.get("transcript"):
+            transcript += audio["transcript"]
+            if on_transcript:
+                on_transcript(transcript)
+    return transcript, _pcm16_to_wav(bytes(pcm)), audio_id
+
+
+# Static parts of a minimal .docx package; only word/document.xml varies.
+_DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType='
+    '"application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    "</Types>"
+)
+_DOCX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+    'relationships/officeDocument" Target="word/document.xml"/>'
+    "</Relationships>"
+)
+_DOCX_DOCUMENT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships"/>'
+)
+_DOCX_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+)
+_DOCX_TAIL = "<w:sectPr/></w:body></w:document>"
+_BOLD = "<w:rPr><w:b/></w:rPr>"
+_TITLE = '<w:rPr><w:b/><w:sz w:val="32"/></w:rPr>'  # bold 16 pt, in place of a Heading 1 style
+
+
+# Characters outside the XML 1.0 Char production; Word refuses the file if any
+# reach document.xml (e.g. stray control codes in model or Whisper output).
+_XML_ILLEGAL_RE = re.compile("[^\t\n\r\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]")
+# Line breaks and tabs become <w:br/> / <w:tab/>, as python-docx's add_run does.
+_RUN_SPLIT_RE = re.compile(r"(\r\n|[\r\n\t])")
+
+
+def _docx_run(text: str, rpr: str = "") -> str:
+    content = []
+    for piece in _RUN_SPLIT_RE.split(_XML_ILLEGAL_RE.sub("", text)):
+        if piece == "\t":
+            content.append("<w:tab/>")
+        elif piece in ("\n", "\r", "\r\n"):
+            content.append("<w:br/>")
+        elif piece:
+            content.append(f'<w:t xml:space="preserve">{escape(piece)}</w:t>')
+    return f"<w:r>{rpr}{''.join(content)}</w:r>"
+
+
+def _build_transcript_docx(case: dict, history: list[dict], generated: str) -> bytes:
+    """Build a Word document from the interview history and return raw bytes.
+
+    Writes the WordprocessingML directly rather than going through
+    python-docx's object model; the layout is the same title, byline and
+    one bold-labelled paragraph per turn. ``generated`` is the byline's
+    timestamp, passed in so the cached wrapper can key on it.
+    """
+    parts = [
+        _DOCX_HEAD,
+        "<w:p>" + _docx_run(case.get("case_title", "Untitled Case"), _TITLE) + "</w:p>",
+        "<w:p>" + _docx_run(
+            f"Case #{case.get('case_number', '—')} | "
+            f"Generated: {generated}"
+        ) + "</w:p>",
+        "<w:p/>",
+    ]
     for entry in history:
         label = "Student" if entry["role"] == "user" else "Patient"
-        p = doc.add_paragraph()
-        run = p.add_run(f"{label}: ")
-        run.bold = True
-        p.add_run(entry["text"])
+        parts.append(
+            "<w:p>" + _docx_run(f"{label}: ", _BOLD) + _docx_run(entry["text"]) + "</w:p>"
+        )
+    parts.append(_DOCX_TAIL)
 
     buf = io.BytesIO()
-    doc.save(buf)
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", _DOCX_CONTENT_TYPES)
+        zf.writestr("_rels/.rels", _DOCX_RELS)
+        zf.writestr("word/_rels/document.xml.rels", _DOCX_DOCUMENT_RELS)
+        zf.writestr("word/document.xml", "".join(parts))
     return buf.getvalue()
 
 
+@st.cache_data(max_entries=8, show_spinner=False)
+def _cached_transcript_docx(
+    conversation_id: str, turn_count: int, generated: str, _case: dict, _history: list[dict],
+) -> bytes:
+    """Memoized ``_build_transcript_docx`` for the sidebar download button.
+
+    History only ever grows within a conversation, so its id and length
+    identify the content; the underscore arguments are left out of the key.
+    The byline timestamp is part of the key at the minute precision it is
+    printed with, so a later download is rebuilt with a current time.
+    """
+    return _build_transcript_docx(_case, _history, generated)
+
+
 # ── Session state init ───────────────────────────────────────────────────────
 
 if "interview_case" not in st.session_state:
     st.session_state["interview_case"] = None
 if "interview_messages" not in st.session_state:
-    st.session_state["interview_messages"] = []
+    st.session_state["interview_messages"] = []  # conversation turns after the system prompt
+if "interview_system_prompt" not in st.session_state:
+    st.session_state["interview_system_prompt"] = None  # built once per Load Case
 if "interview_voice" not in st.session_state:
     st.session_state["interview_voice"] = None
 if "interview_history" not in st.session_state:
     st.session_state["interview_history"] = []  # list of {"role", "text", "audio_bytes"|None}
 if "interview_conversation_id" not in st.session_state:
     st.session_state["interview_conversation_id"] = None
+if "interview_saved" not in st.session_state:
+    st.session_state["interview_saved"] = {"saved": 0}  # turns stored; advanced by the save worker
 
 # ── Sidebar ──────────────────────────────────────────────────────────────────
 
@@ -161,10 +332,10 @@ with st.sidebar:
             st.session_state["interview_case"] = case
             st.session_state["interview_voice"] = voice
             st.session_state["interview_conversation_id"] = str(uuid.uuid4())
-            st.session_state["interview_messages"] = [
-                {"role": "system", "content": _build_patient_system_prompt(case)},
-            ]
+            st.session_state["interview_system_prompt"] = _build_patient_system_prompt(case)
+            st.session_state["interview_messages"] = []
             st.session_state["interview_history"] = []
+            st.session_state["interview_saved"] = {"saved": 0}
             st.success(f"Loaded: {case.get('case_title', 'Untitled')}")
             st.rerun()
         except Exception as e:
@@ -174,7 +345,10 @@ with st.sidebar:
         st.caption(f"Voice: {st.session_state['interview_voice']}")
 
     if st.session_state["interview_history"]:
-        docx_bytes = _build_transcript_docx(
+        docx_bytes = _cached_transcript_docx(
+            st.session_state["interview_conversation_id"],
+            len(st.session_state["interview_history"]),
+            datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC"),
             st.session_state["interview_case"],
             st.session_state["interview_history"],
         )
@@ -188,9 +362,11 @@ with st.sidebar:
     if st.session_state["interview_case"] and st.button("Reset Interview"):
         st.session_state["interview_case"] = None
         st.session_state["interview_messages"] = []
+        st.session_state["interview_system_prompt"] = None
         st.session_state["interview_voice"] = None
         st.session_state["interview_history"] = []
         st.session_state["interview_conversation_id"] = None
+        st.session_state["interview_saved"] = {"saved": 0}
         st.rerun()
 
 # ── Main area ────────────────────────────────────────────────────────────────
@@ -223,7 +399,9 @@ for entry in st.session_state["interview_history"]:
             st.audio(entry["audio_bytes"], format="audio/wav")
 
 # Audio input
-audio_input = st.audio_input("Record your question")
+# Record at speech-recognition quality: the same bytes go to Whisper, the audio
+# model and history playback, so there is nothing to resample afterwards.
+audio_input = st.audio_input("Record your question", sample_rate=16_000)
 
 if audio_input is not None:
     # Prevent re-processing the same audio on rerun by tracking file id
@@ -235,12 +413,12 @@ if audio_input is not None:
     audio_bytes = audio_input.read()
     audio_b64 = base64.b64encode(audio_bytes).decode("utf-8")
 
-    # Transcribe the student's audio via Whisper
-    with st.spinner("Transcribing your question..."):
-        try:
-            user_text = _transcribe_audio(audio_bytes)
-        except Exception:
-            user_text = "(audio question)"
+    # Chat Completions doesn't return a transcript of input audio, so Whisper
+    # still supplies the student's display text; it runs alongside the patient
+    # reply instead of ahead of it.
+    transcription = _transcribe_pool().submit(
+        _transcribe_audio, _openai_client(os.getenv("OPENAI_API_KEY", "")), audio_bytes,
+    )
 
     # Add user audio message to OpenAI conversation
     st.session_state["interview_messages"].append({
@@ -253,20 +431,37 @@ if audio_input is not None:
         ],
     })
 
-    # Add user turn with transcribed text to display history
-    st.session_state["interview_history"].append({
-        "role": "user",
-        "text": user_text,
-        "audio_bytes": audio_bytes,
-    })
-
+    with st.chat_message("assistant"):
+        reply = st.empty()
     with st.spinner("Patient is responding..."):
         try:
             transcript, wav_bytes, resp_audio_id = _get_ai_response(
+                st.session_state["interview_system_prompt"],
                 st.session_state["interview_messages"],
                 st.session_state["interview_voice"],
+                cache_key=f"interview:{case.get('case_number', 0)}",
+                on_transcript=lambda text: reply.markdown(f"**Patient:** {text}"),
             )
 
+            try:
+                user_text = transcription.result()
+            except Exception:
+                user_text = None
+
+            # Once answered, a question goes back to the model as its transcript
+            # rather than base64 audio, so only the newest turn is re-uploaded.
+            if user_text:
+                st.session_state["interview_messages"][-1]["content"] = [
+                    {"type": "text", "text": user_text},
+                ]
+
+            # Add user turn with transcribed text to display history
+            st.session_state["interview_history"].append({
+                "role": "user",
+                "text": user_text or "(audio question)",
+                "audio_bytes": audio_bytes,
+            })
+
             # Append assistant message using audio id reference for multi-turn
             st.session_state["interview_messages"].append({
                 "role": "assistant",
@@ -280,22 +475,22 @@ if audio_input is not None:
                 "audio_bytes": wav_bytes,
             })
 
-            # Auto-save transcript to DB
-            try:
-                save_transcript(
-                    conversation_id=st.session_state["interview_conversation_id"],
-                    case_number=case.get("case_number", 0),
-                    transcript=[
-                        {"role": e["role"], "text": e["text"]}
-                        for e in st.session_state["interview_history"]
-                    ],
-                )
-            except Exception:
-                pass  # best-effort save; don't block the interview
+            # Append the new turns to the saved transcript off the render path;
+            # best-effort, so a failed save is logged rather than blocking.
+            future = _save_pool().submit(
+                _save_new_turns,
+                st.session_state["interview_conversation_id"],
+                case.get("case_number", 0),
+                [
+                    {"role": e["role"], "text": e["text"]}
+                    for e in st.session_state["interview_history"]
+                ],
+                st.session_state["interview_saved"],
+            )
+            future.add_done_callback(_log_save_failure)
 
             st.rerun()
         except Exception as e:
             st.error(f"Error getting response: {e}")
-            # Remove the failed user and history entries so conversation stays consistent
+            # Remove the failed user message so the conversation stays consistent
             st.session_state["interview_messages"].pop()
-            st.session_state["interview_history"].pop()
@@ -5,13 +5,16 @@ from __future__ import annotations
 import uuid
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from app.api.cases import _local_cache
 from app.api.cases import router as cases_router
+from app.api.transcripts import router as transcripts_router
+from app.evaluation.router import router as evaluation_router
 from app.schemas.medical_case import MedicalCase
 
 
@@ -60,9 +63,40 @@ def mock_redis():
     r.get = AsyncMock(return_value=None)
     r.set = AsyncMock()
     r.delete = AsyncMock()
+    # Pipeline commands are buffered synchronously and sent on execute().
+    pipe = MagicMock()
+    pipe.__aenter__.return_value = pipe
+    pipe.execute = AsyncMock()
+    r.pipeline = MagicMock(return_value=pipe)
     return r
 
 
+@pytest.fixture()
+def evaluation_request_data() -> dict:
+    return {
+        "case_description": {"chief_complaint": "Chest pain"},
+        "transcript": {
+            "session_id": "s-1",
+            "turns": [
+                {"turn_number": 1, "speaker": "Student", "content": "What brings you in?"},
+                {"turn_number": 2, "speaker": "Patient", "content": "My chest hurts."},
+            ],
+        },
+        "layer": "case_fidelity",
+    }
+
+
+@pytest.fixture()
+def evaluation_result_data() -> dict:
+    return {
+        "layer": "case_fidelity",
+        "dimensions": [],
+        "weighted_total": 4.0,
+        "overall_summary": "Faithful to the case.",
+        "top_recommendation": "None.",
+    }
+
+
 @pytest.fixture()
 def client(mock_pool, mock_redis) -> TestClient:
     @asynccontextmanager
@@ -71,8 +105,11 @@ def client(mock_pool, mock_redis) -> TestClient:
 
     test_app = FastAPI(lifespan=noop_lifespan)
     test_app.include_router(cases_router)
+    test_app.include_router(transcripts_router)
+    test_app.include_router(evaluation_router)
     test_app.state.db_pool = mock_pool
     test_app.state.redis = mock_redis
+    _local_cache.clear()
 
     with TestClient(test_app, raise_server_exceptions=True) as c:
         yield c
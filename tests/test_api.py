@@ -1,22 +1,25 @@
-"""Tests for the cases API using TestClient with mocked DB/Redis."""
+"""Tests for the cases, transcripts and evaluation APIs using TestClient with mocked DB/Redis."""
 
 from __future__ import annotations
 
+import hashlib
 import json
 import uuid
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi.testclient import TestClient
 
+from app.evaluation.schemas import EvaluationResponse, EvaluationResult
+
 
 class TestListCases:
     def test_list_cases_empty(self, client: TestClient, mock_pool):
         mock_pool.acquire.return_value.__aenter__.return_value.fetchval = AsyncMock(return_value=0)
         mock_pool.acquire.return_value.__aenter__.return_value.fetch = AsyncMock(return_value=[])
 
-        with patch("app.api.cases.queries.list_cases", new_callable=AsyncMock) as mock_list:
-            mock_list.return_value = ([], 0)
+        with patch("app.api.cases.queries.list_cases_json", new_callable=AsyncMock) as mock_list:
+            mock_list.return_value = ("[]", 0)
             resp = client.get("/api/v1/cases/")
 
         assert resp.status_code == 200
@@ -25,8 +28,8 @@ class TestListCases:
         assert data["total"] == 0
 
     def test_list_cases_with_search(self, client: TestClient, mock_pool):
-        with patch("app.api.cases.queries.list_cases", new_callable=AsyncMock) as mock_list:
-            mock_list.return_value = ([], 0)
+        with patch("app.api.cases.queries.list_cases_json", new_callable=AsyncMock) as mock_list:
+            mock_list.return_value = ("[]", 0)
             resp = client.get("/api/v1/cases/", params={"search": "chest"})
 
         assert resp.status_code == 200
@@ -34,6 +37,59 @@ class TestListCases:
         call_kwargs = mock_list.call_args
         assert call_kwargs.kwargs.get("search") == "chest" or call_kwargs[1].get("search") == "chest"
 
+    def test_list_cases_splices_db_json(self, client: TestClient, sample_case_data):
+        items = json.dumps([sample_case_data])
+        with patch("app.api.cases.queries.list_cases_json", new_callable=AsyncMock) as mock_list:
+            mock_list.return_value = (items, 1)
+            resp = client.get("/api/v1/cases/", params={"page": 1, "page_size": 5})
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["items"][0]["case_id"] == sample_case_data["case_id"]
+        assert (data["total"], data["page"], data["page_size"]) == (1, 1, 5)
+
+    def test_list_cases_canonicalizes_stored_documents(self, client: TestClient, sample_case_data):
+        # A PATCH-merged document can carry keys MedicalCase doesn't know.
+        items = json.dumps([{**sample_case_data, "legacy_field": 1}])
+        with patch("app.api.cases.queries.list_cases_json", new_callable=AsyncMock) as mock_list:
+            mock_list.return_value = (items, 1)
+            resp = client.get("/api/v1/cases/")
+
+        assert resp.status_code == 200
+        item = resp.json()["items"][0]
+        assert "legacy_field" not in item
+        assert item["case_id"] == sample_case_data["case_id"]
+
+    def test_list_cases_rejects_bad_page(self, client: TestClient):
+        resp = client.get("/api/v1/cases/", params={"page": 0})
+        assert resp.status_code == 422
+
+    def test_list_cases_rejects_oversized_page(self, client: TestClient):
+        resp = client.get("/api/v1/cases/", params={"page_size": 101})
+        assert resp.status_code == 422
+
+    def test_list_cache_keys_do_not_collide(self, client: TestClient, mock_redis):
+        mock_redis.get = AsyncMock(return_value=None)
+        with patch("app.api.cases.queries.list_cases_json", new_callable=AsyncMock) as mock_list:
+            mock_list.return_value = ("[]", 0)
+            client.get("/api/v1/cases/", params={"specialty": "a:b"})
+            client.get("/api/v1/cases/", params={"specialty": "a", "search": "b:"})
+
+        set_keys = [c.args[0] for c in mock_redis.set.call_args_list]
+        assert len(set(set_keys)) == 2
+
+    def test_list_cases_from_cache(self, client: TestClient, mock_redis):
+        cached = json.dumps({"items": [], "total": 7, "page": 1, "page_size": 20})
+        mock_redis.get = AsyncMock(side_effect=["3", cached])
+
+        with patch("app.api.cases.queries.list_cases_json", new_callable=AsyncMock) as mock_list:
+            resp = client.get("/api/v1/cases/")
+
+        assert resp.status_code == 200
+        assert resp.json()["total"] == 7
+        mock_list.assert_not_called()
+        assert mock_redis.get.call_args.args[0].startswith("cases:list:3:")
+
 
 class TestGetCase:
     def test_get_case_not_found(self, client: TestClient, mock_redis):
@@ -45,6 +101,10 @@ class TestGetCase:
 
         assert resp.status_code == 404
 
+    def test_get_case_invalid_uuid(self, client: TestClient):
+        resp = client.get("/api/v1/cases/not-a-uuid")
+        assert resp.status_code == 422
+
     def test_get_case_from_cache(self, client: TestClient, mock_redis, sample_case_data):
         mock_redis.get = AsyncMock(return_value=json.dumps(sample_case_data, default=str))
 
@@ -52,6 +112,34 @@ class TestGetCase:
         assert resp.status_code == 200
         assert resp.json()["case_id"] == sample_case_data["case_id"]
 
+    def test_get_case_served_locally_after_first_hit(self, client: TestClient, mock_redis, sample_case_data):
+        mock_redis.get = AsyncMock(return_value=json.dumps(sample_case_data, default=str))
+
+        for _ in range(2):
+            resp = client.get(f"/api/v1/cases/{sample_case_data['case_id']}")
+            assert resp.status_code == 200
+        mock_redis.get.assert_awaited_once()
+
+    def test_get_case_caches_canonical_json(self, client: TestClient, mock_redis, sample_case):
+        mock_redis.get = AsyncMock(return_value=None)
+        db_row = {"case_json": sample_case.model_dump_json()}
+        with patch("app.api.cases.queries.get_case_by_id", new_callable=AsyncMock, return_value=db_row):
+            resp = client.get(f"/api/v1/cases/{sample_case.case_id}")
+
+        assert resp.status_code == 200
+        pipe = mock_redis.pipeline.return_value
+        pipe.set.assert_any_call(f"case:{sample_case.case_id}", resp.text, ex=3600)
+
+    def test_delete_evicts_local_cache(self, client: TestClient, mock_redis, sample_case_data):
+        url = f"/api/v1/cases/{sample_case_data['case_id']}"
+        mock_redis.get = AsyncMock(return_value=json.dumps(sample_case_data, default=str))
+        client.get(url)
+
+        with patch("app.api.cases.queries.delete_case", new_callable=AsyncMock, return_value=True):
+            client.delete(url)
+        client.get(url)
+        assert mock_redis.get.await_count == 2
+
 
 class TestGetCaseByNumber:
     def test_get_case_by_number_not_found(self, client: TestClient, mock_pool):
@@ -62,17 +150,7 @@ class TestGetCaseByNumber:
         assert resp.status_code == 404
 
     def test_get_case_by_number_success(self, client: TestClient, mock_pool, sample_case_data):
-        now = datetime.now(timezone.utc)
-        db_row = {
-            "case_id": uuid.UUID(sample_case_data["case_id"]),
-            "case_number": 1,
-            "case_title": sample_case_data["case_title"],
-            "specialty": sample_case_data["specialty"],
-            "difficulty": sample_case_data["difficulty"],
-            "case_data": sample_case_data,
-            "created_at": now,
-            "updated_at": now,
-        }
+        db_row = {"case_json": json.dumps({**sample_case_data, "case_number": 1})}
         with patch("app.api.cases.queries.get_case_by_number", new_callable=AsyncMock) as mock_get:
             mock_get.return_value = db_row
             resp = client.get("/api/v1/cases/by-number/1")
@@ -113,6 +191,48 @@ class TestCreateCase:
         assert resp.json()["specialty"] == "general"
 
 
+class TestPatchCase:
+    def test_patch_merges_without_prefetch(self, client: TestClient, mock_redis, sample_case_data):
+        case_id = sample_case_data["case_id"]
+        row = {"case_json": json.dumps({**sample_case_data, "case_title": "Renamed"}), "changed": True}
+        with (
+            patch("app.api.cases.queries.get_case_by_id", new_callable=AsyncMock) as mock_get,
+            patch("app.api.cases.queries.update_case", new_callable=AsyncMock) as mock_update,
+        ):
+            mock_update.return_value = row
+            resp = client.patch(
+                f"/api/v1/cases/{case_id}",
+                json={"case_title": "Renamed", "case_data": {"plan": None}},
+            )
+
+        assert resp.status_code == 200
+        assert resp.json()["case_title"] == "Renamed"
+        mock_get.assert_not_called()
+        assert mock_update.call_args.kwargs["updates"] == {"case_title": "Renamed"}
+        assert mock_update.call_args.kwargs["case_data_patch"] == {"plan": None}
+
+    def test_patch_unchanged_keeps_cache(self, client: TestClient, mock_redis, sample_case_data):
+        row = {"case_json": json.dumps(sample_case_data), "changed": False}
+        with (
+            patch("app.api.cases.queries.update_case", new_callable=AsyncMock) as mock_update,
+            patch("app.api.cases.cache_service.invalidate_case", new_callable=AsyncMock) as mock_inv,
+        ):
+            mock_update.return_value = row
+            resp = client.patch(
+                f"/api/v1/cases/{sample_case_data['case_id']}",
+                json={"case_title": sample_case_data["case_title"]},
+            )
+
+        assert resp.status_code == 200
+        mock_inv.assert_not_called()
+
+    def test_patch_not_found(self, client: TestClient):
+        with patch("app.api.cases.queries.update_case", new_callable=AsyncMock) as mock_update:
+            mock_update.return_value = None
+            resp = client.patch(f"/api/v1/cases/{uuid.uuid4()}", json={"case_title": "x"})
+        assert resp.status_code == 404
+
+
 class TestDeleteCase:
     def test_delete_case_not_found(self, client: TestClient, mock_redis):
         with patch("app.api.cases.queries.delete_case", new_callable=AsyncMock) as mock_del:
@@ -134,7 +254,7 @@ class TestGenerateCase:
             patch("app.api.cases.queries.insert_case", new_callable=AsyncMock) as mock_insert,
         ):
             mock_gen.return_value = sample_case
-            mock_insert.return_value = {}
+            mock_insert.return_value = 42
 
             resp = client.post(
                 "/api/v1/cases/generate",
@@ -143,4 +263,159 @@ class TestGenerateCase:
 
         assert resp.status_code == 200
         assert resp.json()["specialty"] == "cardiology"
+        assert resp.json()["case_number"] == 42
+        assert resp.text == sample_case.model_copy(update={"case_number": 42}).model_dump_json()
+        assert "case_number" not in json.loads(mock_insert.call_args.kwargs["case_data_json"])
         mock_gen.assert_called_once()
+        pipe = mock_redis.pipeline.return_value
+        pipe.set.assert_any_call(f"case:{sample_case.case_id}", resp.text, ex=3600)
+        pipe.set.assert_any_call("case:number:42", str(sample_case.case_id), ex=3600)
+        pipe.incr.assert_called_once_with("cases:version")
+        pipe.execute.assert_awaited_once()
+
+
+    def test_generate_stamps_server_time(self, client: TestClient, mock_redis, sample_case):
+        sample_case.created_at = datetime(2001, 1, 1, tzinfo=timezone.utc)  # as invented by the LLM
+        before = datetime.now(timezone.utc)
+        with (
+            patch("app.api.cases.llm_service.generate_case", new_callable=AsyncMock, return_value=sample_case),
+            patch("app.api.cases.queries.insert_case", new_callable=AsyncMock, return_value=7) as mock_insert,
+        ):
+            resp = client.post("/api/v1/cases/generate", json={})
+
+        now = mock_insert.call_args.kwargs["now"]
+        assert now >= before
+        assert datetime.fromisoformat(resp.json()["created_at"]) == now
+        assert datetime.fromisoformat(resp.json()["updated_at"]) == now
+
+class TestSaveTranscript:
+    def test_save_transcript_parses_conversation_id(self, client: TestClient):
+        conversation_id = uuid.uuid4()
+        row = {"conversation_id": conversation_id, "case_number": 3, "created_at": datetime.now(timezone.utc)}
+        with patch("app.api.transcripts.insert_transcript", new_callable=AsyncMock, return_value=row) as mock_ins:
+            resp = client.post(
+                "/api/v1/transcripts/",
+                json={"conversation_id": str(conversation_id), "case_number": 3, "transcript": []},
+            )
+
+        assert resp.status_code == 201
+        assert mock_ins.call_args.kwargs["conversation_id"] == conversation_id
+
+    def test_save_transcript_rejects_bad_conversation_id(self, client: TestClient):
+        with patch("app.api.transcripts.insert_transcript", new_callable=AsyncMock) as mock_ins:
+            resp = client.post(
+                "/api/v1/transcripts/",
+                json={"conversation_id": "not-a-uuid", "case_number": 3, "transcript": []},
+            )
+
+        assert resp.status_code == 422
+        mock_ins.assert_not_called()
+
+    def test_save_transcript_append_flag(self, client: TestClient):
+        conversation_id = uuid.uuid4()
+        row = {"conversation_id": conversation_id, "case_number": 3, "created_at": datetime.now(timezone.utc)}
+        turns = [{"role": "user", "text": "Hi"}, {"role": "assistant", "text": "Hello"}]
+        with patch("app.api.transcripts.insert_transcript", new_callable=AsyncMock, return_value=row) as mock_ins:
+            resp = client.post(
+                "/api/v1/transcripts/",
+                json={"conversation_id": str(conversation_id), "case_number": 3, "transcript": turns, "append": True},
+            )
+
+        assert resp.status_code == 201
+        assert mock_ins.call_args.kwargs["append"] is True
+        assert mock_ins.call_args.kwargs["transcript"] == turns
+
+
+def _mock_acquire(mock_pool) -> MagicMock:
+    """Wire ``pool.acquire()`` and ``conn.transaction()`` as async context managers."""
+    conn = MagicMock()
+    conn.executemany = AsyncMock()
+    conn.transaction.return_value.__aenter__.return_value = None
+    mock_pool.acquire = MagicMock()
+    mock_pool.acquire.return_value.__aenter__.return_value = conn
+    return conn
+
+
+class TestRunEvaluation:
+    def test_evaluation_persisted_in_background(
+        self, client: TestClient, mock_pool, evaluation_request_data, evaluation_result_data,
+    ):
+        conn = _mock_acquire(mock_pool)
+        response = EvaluationResponse(
+            results=[EvaluationResult(**evaluation_result_data)],
+            model_used="claude",
+            token_usage={"input_tokens": 10, "output_tokens": 5},
+            evaluation_id=uuid.uuid4(),
+            cache_hit=True,
+        )
+        with patch("app.evaluation.router.evaluate_transcript", new_callable=AsyncMock, return_value=response):
+            resp = client.post("/api/v1/evaluate/", json=evaluation_request_data)
+
+        assert resp.status_code == 200
+        assert resp.headers["X-Cache"] == "HIT"
+        conn.transaction.assert_called_once()
+        sql, rows = conn.executemany.await_args.args
+        assert "INSERT INTO evaluations" in sql
+        evaluation_id, session_id, layer, result, model_used, token_usage, created_at = rows[0]
+        assert (evaluation_id, session_id, layer, model_used) == (
+            response.evaluation_id, "s-1", "case_fidelity", "claude",
+        )
+        assert json.loads(result)[0]["overall_summary"] == "Faithful to the case."
+        assert json.loads(token_usage) == {"input_tokens": 10, "output_tokens": 5}
+        assert created_at == response.timestamp
+
+    def test_batch_persists_all_rows_in_one_call(
+        self, client: TestClient, mock_pool, evaluation_request_data, evaluation_result_data,
+    ):
+        conn = _mock_acquire(mock_pool)
+        response = EvaluationResponse(
+            results=[EvaluationResult(**evaluation_result_data)], model_used="claude",
+            evaluation_id=uuid.uuid4(),
+        )
+        with patch("app.evaluation.router.evaluate_transcript", new_callable=AsyncMock, return_value=response):
+            resp = client.post("/api/v1/evaluate/batch", json=[evaluation_request_data] * 3)
+
+        assert resp.status_code == 200
+        assert len(resp.json()) == 3
+        conn.executemany.assert_awaited_once()
+        assert len(conn.executemany.await_args.args[1]) == 3
+
+    def test_persist_failure_does_not_fail_request(
+        self, client: TestClient, mock_pool, evaluation_request_data, evaluation_result_data,
+    ):
+        conn = _mock_acquire(mock_pool)
+        conn.executemany.side_effect = RuntimeError("db down")
+        response = EvaluationResponse(
+            results=[EvaluationResult(**evaluation_result_data)], model_used="claude",
+            evaluation_id=uuid.uuid4(),
+        )
+        with patch("app.evaluation.router.evaluate_transcript", new_callable=AsyncMock, return_value=response):
+            resp = client.post("/api/v1/evaluate/", json=evaluation_request_data)
+
+        assert resp.status_code == 200
+
+
+class TestRubrics:
+    def test_rubric_list_etag_matches_body(self, client: TestClient):
+        resp = client.get("/api/v1/evaluate/rubrics/list")
+
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] == f'"{hashlib.blake2b(resp.content, digest_size=16).hexdigest()}"'
+        assert resp.headers["Cache-Control"] == "public, max-age=3600"
+        assert resp.json()["rubrics"]
+
+    def test_rubric_detail_if_none_match_returns_304(self, client: TestClient):
+        etag = client.get("/api/v1/evaluate/rubrics/case_fidelity").headers["ETag"]
+
+        resp = client.get("/api/v1/evaluate/rubrics/case_fidelity", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["ETag"] == etag
+
+    def test_rubric_stale_etag_returns_body(self, client: TestClient):
+        resp = client.get("/api/v1/evaluate/rubrics/case_fidelity", headers={"If-None-Match": '"stale"'})
+        assert resp.status_code == 200
+        assert resp.json()["layer"] == "case_fidelity"
+
+    def test_unknown_rubric_layer(self, client: TestClient):
+        assert client.get("/api/v1/evaluate/rubrics/nope").status_code == 404
@@ -0,0 +1,70 @@
+"""Tests for the dashboard's streaming .docx paragraph reader."""
+
+from __future__ import annotations
+
+import io
+import zipfile
+
+import pytest
+
+from frontend.docx_reader import iter_paragraphs
+
+_NS = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" '
+    'xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape"'
+)
+_DOCUMENT = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document {_NS}><w:body>
+<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr><w:r><w:t>Medications</w:t></w:r></w:p>
+<w:p><w:r><w:t>Aspirin</w:t><w:br/><w:t>Metformin</w:t></w:r><w:r><w:cr/><w:t>Lisinopril</w:t></w:r></w:p>
+<w:p><w:r><w:t>BP</w:t><w:tab/><w:t>140/90</w:t><w:br w:type="page"/></w:r></w:p>
+<w:tbl><w:tr><w:tc><w:p><w:r><w:t>table cell</w:t></w:r></w:p></w:tc></w:tr></w:tbl>
+<w:p><w:r><w:t>Before box</w:t></w:r><w:r><mc:AlternateContent>
+<mc:Choice Requires="wps"><w:drawing><wps:txbx><w:txbxContent>
+<w:p><w:r><w:t>text box</w:t></w:r></w:p></w:txbxContent></wps:txbx></w:drawing></mc:Choice>
+<mc:Fallback><w:pict><w:txbxContent>
+<w:p><w:r><w:t>text box</w:t></w:r></w:p></w:txbxContent></w:pict></mc:Fallback>
+</mc:AlternateContent></w:r><w:hyperlink><w:r><w:t> and link</w:t></w:r></w:hyperlink></w:p>
+<w:sectPr/></w:body></w:document>"""
+
+_EXPECTED = [
+    ("Heading1", "Medications"),
+    ("", "Aspirin\nMetformin\nLisinopril"),
+    ("", "BP\t140/90"),
+    ("", "Before box and link"),
+]
+
+
+@pytest.fixture
+def docx_bytes() -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("word/document.xml", _DOCUMENT)
+    return buf.getvalue()
+
+
+class TestIterParagraphs:
+    def test_breaks_tabs_and_body_level_only(self, docx_bytes: bytes):
+        assert list(iter_paragraphs(docx_bytes)) == _EXPECTED
+
+    def test_matches_python_docx(self, docx_bytes: bytes):
+        docx = pytest.importorskip("docx")
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            # python-docx needs a full package around the same document part.
+            with zipfile.ZipFile(io.BytesIO(_blank_docx(docx))) as blank:
+                for item in blank.infolist():
+                    if item.filename != "word/document.xml":
+                        zf.writestr(item, blank.read(item))
+            zf.writestr("word/document.xml", _DOCUMENT)
+        doc = docx.Document(io.BytesIO(buf.getvalue()))
+        assert [text for _, text in iter_paragraphs(buf.getvalue())] == [
+            p.text.strip() for p in doc.paragraphs
+        ]
+
+
+def _blank_docx(docx) -> bytes:
+    out = io.BytesIO()
+    docx.Document().save(out)
+    return out.getvalue()
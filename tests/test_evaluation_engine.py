@@ -0,0 +1,78 @@
+"""Tests for the evaluation engine's result cache."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import orjson
+
+from app.evaluation import engine
+from app.evaluation.schemas import EvaluationRequest, EvaluationResult
+
+
+def _result(layer: str, evaluation_result_data: dict) -> EvaluationResult:
+    return EvaluationResult(**{**evaluation_result_data, "layer": layer})
+
+
+class TestCacheKey:
+    def test_model_changes_key(self, evaluation_request_data: dict):
+        claude = EvaluationRequest.model_validate({**evaluation_request_data, "model": "claude"})
+        gpt = EvaluationRequest.model_validate({**evaluation_request_data, "model": "gpt-4o"})
+        assert engine._cache_key(claude, "case_fidelity") != engine._cache_key(gpt, "case_fidelity")
+
+    def test_key_ignores_session_metadata(self, evaluation_request_data: dict):
+        a = EvaluationRequest.model_validate(evaluation_request_data)
+        transcript = {**evaluation_request_data["transcript"], "session_id": "other"}
+        b = EvaluationRequest.model_validate({**evaluation_request_data, "transcript": transcript})
+        assert engine._cache_key(a, "case_fidelity") == engine._cache_key(b, "case_fidelity")
+
+
+class TestCachedEvaluation:
+    def test_mget_splits_hits_and_misses(self, evaluation_request_data: dict, evaluation_result_data: dict):
+        request = EvaluationRequest.model_validate({**evaluation_request_data, "layer": "both"})
+        hit = {
+            "result": _result("case_fidelity", evaluation_result_data).model_dump(mode="json"),
+            "model_used": "claude",
+            "token_usage": {"input_tokens": 3, "output_tokens": 1},
+        }
+        r = AsyncMock()
+        r.mget = AsyncMock(return_value=[orjson.dumps(hit), None])
+        judged = _result("student_performance", evaluation_result_data)
+        judge = AsyncMock(return_value=(judged, {"input_tokens": 7, "output_tokens": 2}))
+
+        with patch.dict(engine._JUDGES, {"claude": judge}):
+            response = asyncio.run(engine.evaluate_transcript(request, r=r))
+
+        keys = [engine._cache_key(request, layer) for layer in ("case_fidelity", "student_performance")]
+        r.mget.assert_awaited_once_with(keys)
+        # Only the missed layer reaches the judge, and only it is written back.
+        judge.assert_awaited_once()
+        assert judge.await_args.args[2] == "student_performance"
+        r.set.assert_awaited_once()
+        key, payload = r.set.await_args.args
+        assert key == keys[1]
+        assert orjson.loads(payload)["result"]["layer"] == "student_performance"
+        assert [res.layer for res in response.results] == ["case_fidelity", "student_performance"]
+        assert response.token_usage == {"input_tokens": 10, "output_tokens": 3}
+        assert response.cache_hit is False
+
+    def test_all_layers_cached(self, evaluation_request_data: dict, evaluation_result_data: dict):
+        request = EvaluationRequest.model_validate(evaluation_request_data)
+        hit = {"result": evaluation_result_data, "model_used": "gpt-4o", "token_usage": {}}
+        r = AsyncMock()
+        r.mget = AsyncMock(return_value=[orjson.dumps(hit)])
+        judge = AsyncMock()
+
+        with patch.dict(engine._JUDGES, {"claude": judge}):
+            response = asyncio.run(engine.evaluate_transcript(request, r=r))
+
+        judge.assert_not_awaited()
+        r.set.assert_not_awaited()
+        assert response.cache_hit is True
+        assert response.model_used == "gpt-4o"
+
+    def test_cache_read_failure_falls_through(self):
+        r = AsyncMock()
+        r.mget = AsyncMock(side_effect=ConnectionError("redis down"))
+        assert asyncio.run(engine._get_cached_many(r, ["a", "b"])) == [None, None]
@@ -6,12 +6,14 @@ import uuid
 
 import pytest
 
+from app.evaluation.engine import _EVALUATION_TEXT_FORMAT
 from app.schemas.medical_case import (
     Difficulty,
     MedicalCase,
     PatientDemographics,
     VitalSigns,
 )
+from app.services.llm_service import _CASE_TEXT_FORMAT
 
 
 class TestMedicalCaseRoundTrip:
@@ -37,6 +39,12 @@ class TestMedicalCaseRoundTrip:
         assert case.review_of_systems == []
         assert case.family_history == []
 
+    def test_default_timestamps(self, sample_case_data: dict):
+        del sample_case_data["created_at"], sample_case_data["updated_at"]
+        case = MedicalCase.model_validate(sample_case_data)
+        assert case.created_at.tzinfo is not None
+        assert case.updated_at is None
+
 
 class TestVitalSignsValidation:
     def test_valid_vitals(self):
@@ -73,17 +81,32 @@ class TestDemographicsValidation:
         with pytest.raises(ValueError):
             PatientDemographics(age=200, sex="male")
 
+    def test_sections_are_frozen(self):
+        d = PatientDemographics(age=30, sex="female")
+        with pytest.raises(ValueError):
+            d.age = 31
+
+    def test_vocabulary_fields_interned(self, sample_case_data: dict):
+        sample_case_data["family_history"] = [{"relation": "".join(["fa", "ther"])}]
+        a = MedicalCase.model_validate(sample_case_data)
+        b = MedicalCase.model_validate_json(a.model_dump_json())
+        assert a.family_history[0].relation is b.family_history[0].relation
+
 
 class TestCaseIdValidation:
     def test_valid_uuid(self, sample_case_data: dict):
         case = MedicalCase.model_validate(sample_case_data)
-        uuid.UUID(case.case_id)  # should not raise
+        assert case.case_id == uuid.UUID(sample_case_data["case_id"])
 
-    def test_invalid_uuid_gets_replaced(self, sample_case_data: dict):
+    def test_invalid_uuid_rejected(self, sample_case_data: dict):
         sample_case_data["case_id"] = "not-a-uuid"
+        with pytest.raises(ValueError):
+            MedicalCase.model_validate(sample_case_data)
+
+    def test_missing_uuid_generated(self, sample_case_data: dict):
+        del sample_case_data["case_id"]
         case = MedicalCase.model_validate(sample_case_data)
-        # Should auto-generate a valid UUID instead of raising
-        uuid.UUID(case.case_id)  # doesn't raise
+        assert isinstance(case.case_id, uuid.UUID)
 
 
 class TestDifficultyEnum:
@@ -94,3 +117,28 @@ class TestDifficultyEnum:
         sample_case_data["difficulty"] = "hard"
         case = MedicalCase.model_validate(sample_case_data)
         assert case.difficulty == Difficulty.HARD
+
+
+def _assert_strict(node):
+    """Every object must close additionalProperties and require all its properties."""
+    if isinstance(node, dict):
+        if node.get("type") == "object":
+            assert node.get("additionalProperties") is False
+            assert sorted(node.get("required", [])) == sorted(node.get("properties", {}))
+        for value in node.values():
+            _assert_strict(value)
+    elif isinstance(node, list):
+        for value in node:
+            _assert_strict(value)
+
+
+class TestStructuredOutputFormats:
+    def test_case_format_is_strict(self):
+        assert _CASE_TEXT_FORMAT["strict"] is True
+        assert "demographics" in _CASE_TEXT_FORMAT["schema"]["properties"]
+        _assert_strict(_CASE_TEXT_FORMAT["schema"])
+
+    def test_evaluation_format_is_strict(self):
+        assert _EVALUATION_TEXT_FORMAT["strict"] is True
+        assert "dimensions" in _EVALUATION_TEXT_FORMAT["schema"]["properties"]
+        _assert_strict(_EVALUATION_TEXT_FORMAT["schema"])